@@ -16,11 +16,28 @@ class CVImage(np.ndarray):
         The channel of the image is RGB, which is different from the channel of the image in OpenCV,
         but the same as the channel of the image in PIL and Tensorflow.
 
+        The RGB order is usually expressed as a reversed (negative-stride) view over the
+        natively decoded BGR buffer rather than a converted copy. Readers that are asked
+        for ``channel_order="bgr"`` hand out the decoded buffer untouched.
+
+        Being an ndarray subclass, CVImage exposes the standard
+        ``__array_interface__`` protocol, so torch/CuPy/PIL consumers can pick
+        up the underlying pointer without a copy; ``np.asarray(image)`` is a
+        zero-copy view as well. The stride descriptors stay consistent for the
+        negative-stride RGB case, but consumers that insist on contiguous
+        memory (e.g. ``torch.from_numpy``) should read with
+        ``channel_order="bgr"`` or call ``np.ascontiguousarray`` once.
+
     Methods:
         from_numpy: Create a CVImage object from a numpy.ndarray object.
         then: Apply a function to the CVImage object.
     """
 
+    # Unlike plain ndarray, a subclass grows a per-instance __dict__ unless slots
+    # are declared. An empty __slots__ keeps .view(CVImage) a pure header copy
+    # with no extra allocation, so wrapping a frame stays effectively free.
+    __slots__ = ()
+
     @classmethod
     def from_numpy(cls, x: np.ndarray):
         """ Create a CVImage object from a numpy.ndarray object.
@@ -43,10 +60,14 @@ class CVImage(np.ndarray):
             **kwargs: Other arguments.
 
         Returns:
-            A numpy.ndarray object.
+            A numpy.ndarray object. A zero-copy view when dtype is None or already matches,
+            otherwise a converted copy.
 
         """
-        return self.view(np.ndarray).astype(dtype)
+        result = self.view(np.ndarray)
+        if dtype is None or np.dtype(dtype) == result.dtype:
+            return result
+        return result.astype(dtype)
 
     def __array__(self, dtype=None, **kwargs) -> np.ndarray:
         return self.to_numpy(dtype, **kwargs)
@@ -77,6 +98,10 @@ class CVVideo(metaclass=ABCMeta):
         __len__: Get the length of the video.
     """
 
+    # Empty slots keep the base from forcing a per-instance __dict__ onto
+    # subclasses that declare their own slots.
+    __slots__ = ()
+
     @abstractmethod
     def __next__(self) -> CVImage:
         ...  # pragma: no cover
@@ -99,11 +124,18 @@ class CVVideo(metaclass=ABCMeta):
 
     @property
     def wait_time(self) -> float:
-        return 1 / self.fps
+        # Reading fps may hit the capture backend (cap.get), so the inversion is
+        # computed once and cached. The fps setter refreshes the cached value.
+        wait_time = getattr(self, '_wait_time', None)
+        if wait_time is None:
+            wait_time = 1 / self.fps
+            self._wait_time = wait_time
+        return wait_time
 
     @wait_time.setter
     def wait_time(self, value: float):
         self.fps = 1 / value
+        self._wait_time = value
 
     @property
     @abstractmethod
@@ -1,4 +1,5 @@
-from functools import wraps
+import functools
+import inspect
 from typing import (Any, Callable, TypeVar)
 
 import numpy as np
@@ -7,8 +8,46 @@ TInput = TypeVar('TInput')
 TOutput = TypeVar('TOutput')
 
 
+def _bind_trailing_args(fn: Callable, args: tuple, kwargs: dict) -> Callable:
+    """Bind ``fn(x, *args, **kwargs)`` down to a single-argument callable.
+
+    A plain closure costs one extra Python frame per application. Since the
+    bound arguments all come after the data argument, they can be attached by
+    keyword instead: the parameter names are resolved from the signature once
+    here, and the result is a ``functools.partial`` whose call is C-level, so
+    applying the transformer enters ``fn`` directly. Signatures that cannot be
+    bound by keyword (e.g. positional-only or ``*args`` parameters) keep the
+    closure fallback.
+    """
+    if not args:
+        return functools.partial(fn, **kwargs) if kwargs else fn
+
+    try:
+        params = list(inspect.signature(fn).parameters.values())[1:]
+    except (TypeError, ValueError):
+        params = []
+    names = []
+    for param, _ in zip(params, args):
+        if param.kind not in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+            break
+        names.append(param.name)
+    if len(names) == len(args):
+        return functools.partial(fn, **dict(zip(names, args)), **kwargs)
+
+    @functools.wraps(fn)
+    def wrapper(x):
+        return fn(x, *args, **kwargs)
+
+    return wrapper
+
+
 class Transformer:
 
+    # One slot instead of a per-instance __dict__: transformers are created in
+    # large numbers by pipelines and factories, and the only state is the
+    # callable itself.
+    __slots__ = ('_fn',)
+
     def __init__(self, fn: Callable):
         self._fn = fn
 
@@ -16,52 +55,34 @@ class Transformer:
         return self._fn(x)
 
 
+# The subclasses used to re-define __call__ just to narrow the annotations,
+# which stacked an extra Python frame on every frame processed. Application
+# goes straight through Transformer.__call__ now; the subclasses only carry
+# their factory and their role in isinstance checks.
+
+
 class Filter(Transformer):
 
-    def __call__(self, x: np.ndarray) -> Callable[[
-            np.ndarray,
-    ], np.ndarray]:
-        return super().__call__(x)
+    __slots__ = ()
 
     @classmethod
     def make(cls, fn: Callable[..., np.ndarray], *args, **kwargs) -> 'Filter':
-
-        @wraps(fn)
-        def wrapper(x: np.ndarray) -> np.ndarray:
-            return fn(x, *args, **kwargs)
-
-        return cls(wrapper)
+        return cls(_bind_trailing_args(fn, args, kwargs))
 
 
 class Converter(Transformer):
 
-    def __call__(self, x: np.ndarray) -> Callable[[
-            np.ndarray,
-    ], np.ndarray]:
-        return super().__call__(x)
+    __slots__ = ()
 
     @classmethod
     def make(cls, fn: Callable[..., np.ndarray], *args, **kwargs) -> 'Converter':
-
-        @wraps(fn)
-        def wrapper(x: np.ndarray) -> np.ndarray:
-            return fn(x, *args, **kwargs)
-
-        return cls(wrapper)
+        return cls(_bind_trailing_args(fn, args, kwargs))
 
 
 class Tool(Transformer):
 
-    def __call__(self, x: np.ndarray) -> Callable[[
-            np.ndarray,
-    ], Any]:
-        return super().__call__(x)
+    __slots__ = ()
 
     @classmethod
-    def make(cls, fn: Callable[..., np.ndarray], *args, **kwargs) -> 'Tool':
-
-        @wraps(fn)
-        def wrapper(x: np.ndarray) -> np.ndarray:
-            return fn(x, *args, **kwargs)
-
-        return cls(wrapper)
+    def make(cls, fn: Callable[..., Any], *args, **kwargs) -> 'Tool':
+        return cls(_bind_trailing_args(fn, args, kwargs))
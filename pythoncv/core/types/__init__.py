@@ -4,17 +4,47 @@ This module contains type definitions for PythonCV.
 
 """
 
+import importlib
+
 from .video import (
     VideoCaptureProperties,
     VideoWriterProperties,
-    CAPTURE_BACKEND_DICT,
+    CAPTURE_BACKENDS_SET,
     CaptureBackends,
+    HardwareAccelerations,
     FourCC,
+    FOURCC_SET,
+    fourcc_code,
 )
-from .display import (
-    WINDOW_FLAGS_DICT,
-    WINDOW_FLAGS_INVERSE_DICT,
-    WindowFlags,
-)
-from .filter import (BORDER_TYPES_DICT, BorderTypes)
-from .image import (IMAGE_READ_FLAG_DICT, ImageReadFlags, IMAGE_WRITE_FLAG_DICT, ImageWriteFlags)
+from .display import WindowFlags
+from .filter import (BORDER_TYPES_SET, BorderTypes, resolve_border_type)
+from .image import (ImageReadFlags, ImageWriteFlags)
+
+# The cv2-backed constant tables are re-exported lazily (PEP 562, like the
+# submodules themselves do) so that importing the schema and Literal types
+# never loads cv2.
+_LAZY_ATTRS = {
+    'CAPTURE_BACKEND_DICT': '.video',
+    'HARDWARE_ACCELERATION_DICT': '.video',
+    'WINDOW_FLAGS_DICT': '.display',
+    'WINDOW_FLAGS_INVERSE_DICT': '.display',
+    'BORDER_CONSTANT': '.filter',
+    'BORDER_DEFAULT': '.filter',
+    'BORDER_ISOLATED': '.filter',
+    'BORDER_REFLECT': '.filter',
+    'BORDER_REFLECT101': '.filter',
+    'BORDER_REPLICATE': '.filter',
+    'BORDER_WRAP': '.filter',
+    'BORDER_TYPES_DICT': '.filter',
+    'IMAGE_READ_FLAG_DICT': '.image',
+    'IMAGE_WRITE_FLAG_DICT': '.image',
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
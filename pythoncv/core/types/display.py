@@ -1,25 +1,36 @@
 from typing import Literal
 
-import cv2  # type: ignore
-
-__all__ = [
+__all__ = [  # noqa: F822 -- the tables are provided lazily by __getattr__ (PEP 562)
     'WINDOW_FLAGS_DICT',
     'WINDOW_FLAGS_INVERSE_DICT',
     'WindowFlags',
 ]
 
-WINDOW_FLAGS_DICT = {
-    'normal': cv2.WINDOW_NORMAL,
-    'autosize': cv2.WINDOW_AUTOSIZE,
-    'opengl': cv2.WINDOW_OPENGL,
-    'fullscreen': cv2.WINDOW_FULLSCREEN,
-    'freeratio': cv2.WINDOW_FREERATIO,
-    'keepratio': cv2.WINDOW_KEEPRATIO,
-    'gui_expanded': cv2.WINDOW_GUI_EXPANDED,
-    'gui_normal': cv2.WINDOW_GUI_NORMAL,
-}
-
-WINDOW_FLAGS_INVERSE_DICT = {v: k for k, v in WINDOW_FLAGS_DICT.items()}
-
 WindowFlags = Literal['normal', 'autosize', 'opengl', 'fullscreen', 'freeratio', 'keepratio', 'gui_expanded',
                       'gui_normal',]
+
+
+# The flag tables need cv2, which costs a few hundred milliseconds and a lot
+# of RSS at import. They are built on first access instead (PEP 562), so
+# importing the type definitions alone never loads cv2.
+def _build_tables():
+    import cv2  # type: ignore
+    flags = {
+        'normal': cv2.WINDOW_NORMAL,
+        'autosize': cv2.WINDOW_AUTOSIZE,
+        'opengl': cv2.WINDOW_OPENGL,
+        'fullscreen': cv2.WINDOW_FULLSCREEN,
+        'freeratio': cv2.WINDOW_FREERATIO,
+        'keepratio': cv2.WINDOW_KEEPRATIO,
+        'gui_expanded': cv2.WINDOW_GUI_EXPANDED,
+        'gui_normal': cv2.WINDOW_GUI_NORMAL,
+    }
+    globals()['WINDOW_FLAGS_DICT'] = flags
+    globals()['WINDOW_FLAGS_INVERSE_DICT'] = {v: k for k, v in flags.items()}
+
+
+def __getattr__(name):
+    if name in ('WINDOW_FLAGS_DICT', 'WINDOW_FLAGS_INVERSE_DICT'):
+        _build_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,91 @@
-from typing import Literal
+from typing import Literal, get_args
 
-import cv2  # type: ignore
-
-__all__ = [
+__all__ = [  # noqa: F822 -- the tables are provided lazily by __getattr__ (PEP 562)
+    'BORDER_CONSTANT',
+    'BORDER_DEFAULT',
+    'BORDER_ISOLATED',
+    'BORDER_REFLECT',
+    'BORDER_REFLECT101',
+    'BORDER_REPLICATE',
     'BORDER_TYPES_DICT',
+    'BORDER_TYPES_SET',
+    'BORDER_WRAP',
     'BorderTypes',
+    'MORPH_SHAPES_DICT',
+    'MorphShapes',
+    'resolve_border_type',
 ]
 
-BORDER_TYPES_DICT = {
-    'constant': cv2.BORDER_CONSTANT,
-    'replicate': cv2.BORDER_REPLICATE,
-    'reflect': cv2.BORDER_REFLECT,
-    'reflect101': cv2.BORDER_REFLECT_101,
-    'wrap': cv2.BORDER_WRAP,
-    'isolated': cv2.BORDER_ISOLATED,
-    'default': cv2.BORDER_DEFAULT,
-}
-
 BorderTypes = Literal['constant', 'replicate', 'reflect', 'reflect101', 'wrap', 'isolated', 'default']
+
+# Precomputed membership table for runtime validation; built once at import so
+# validators do not have to touch the Literal/typing machinery or dict views.
+BORDER_TYPES_SET = frozenset(get_args(BorderTypes))
+
+MorphShapes = Literal['rect', 'cross', 'ellipse']
+
+_LAZY_NAMES = frozenset({
+    'BORDER_CONSTANT',
+    'BORDER_REPLICATE',
+    'BORDER_REFLECT',
+    'BORDER_REFLECT101',
+    'BORDER_WRAP',
+    'BORDER_ISOLATED',
+    'BORDER_DEFAULT',
+    'BORDER_TYPES_DICT',
+    'MORPH_SHAPES_DICT',
+})
+
+
+# The constant tables need cv2, which costs a few hundred milliseconds at
+# import. They are built on first access instead (PEP 562): the modules that
+# actually filter images import cv2 anyway, while importing the type
+# definitions alone stays cheap. Once built, the names live in the module
+# dict, so the pre-resolved ints stay free on hot paths.
+def _build_tables():
+    import cv2  # type: ignore
+    g = globals()
+    g['BORDER_CONSTANT'] = cv2.BORDER_CONSTANT
+    g['BORDER_REPLICATE'] = cv2.BORDER_REPLICATE
+    g['BORDER_REFLECT'] = cv2.BORDER_REFLECT
+    g['BORDER_REFLECT101'] = cv2.BORDER_REFLECT_101
+    g['BORDER_WRAP'] = cv2.BORDER_WRAP
+    g['BORDER_ISOLATED'] = cv2.BORDER_ISOLATED
+    g['BORDER_DEFAULT'] = cv2.BORDER_DEFAULT
+    g['BORDER_TYPES_DICT'] = {
+        'constant': cv2.BORDER_CONSTANT,
+        'replicate': cv2.BORDER_REPLICATE,
+        'reflect': cv2.BORDER_REFLECT,
+        'reflect101': cv2.BORDER_REFLECT_101,
+        'wrap': cv2.BORDER_WRAP,
+        'isolated': cv2.BORDER_ISOLATED,
+        'default': cv2.BORDER_DEFAULT,
+    }
+    g['MORPH_SHAPES_DICT'] = {
+        'rect': cv2.MORPH_RECT,
+        'cross': cv2.MORPH_CROSS,
+        'ellipse': cv2.MORPH_ELLIPSE,
+    }
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _build_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def resolve_border_type(border_type) -> int:
+    """Resolve a border-type name (or pre-resolved cv2 int) to its cv2 constant.
+
+    Integers pass straight through, so filter factories and loops can look the
+    flag up once and reuse the int on every subsequent call.
+    """
+    if type(border_type) is int:
+        return border_type
+    try:
+        table = BORDER_TYPES_DICT
+    except NameError:
+        _build_tables()
+        table = globals()['BORDER_TYPES_DICT']
+    return table[border_type]
@@ -1,38 +1,47 @@
 from typing import Literal
 
-import cv2  # type: ignore
-
-__all__ = [
+__all__ = [  # noqa: F822 -- the tables are provided lazily by __getattr__ (PEP 562)
     'IMAGE_READ_FLAG_DICT',
     'ImageReadFlags',
     'IMAGE_WRITE_FLAG_DICT',
     'ImageWriteFlags',
 ]
 
-IMAGE_READ_FLAG_DICT = {
-    'unchanged': cv2.IMREAD_UNCHANGED,
-    'grayscale': cv2.IMREAD_GRAYSCALE,
-    'color': cv2.IMREAD_COLOR,
-    'anydepth': cv2.IMREAD_ANYDEPTH,
-    'anycolor': cv2.IMREAD_ANYCOLOR,
-    'load_gdal': cv2.IMREAD_LOAD_GDAL,
-    'ignore_orientation': cv2.IMREAD_IGNORE_ORIENTATION,
-    ('grayscale', 2): cv2.IMREAD_REDUCED_GRAYSCALE_2,
-    ('grayscale', 4): cv2.IMREAD_REDUCED_GRAYSCALE_4,
-    ('grayscale', 8): cv2.IMREAD_REDUCED_GRAYSCALE_8,
-    ('color', 2): cv2.IMREAD_REDUCED_COLOR_2,
-    ('color', 4): cv2.IMREAD_REDUCED_COLOR_4,
-    ('color', 8): cv2.IMREAD_REDUCED_COLOR_8,
-}
-
 ImageReadFlags = Literal['unchanged', 'grayscale', 'color',]
 
-IMAGE_WRITE_FLAG_DICT = {
-    'jpeg': cv2.IMWRITE_JPEG_QUALITY,
-    'png': cv2.IMWRITE_PNG_COMPRESSION,
-    'webp': cv2.IMWRITE_WEBP_QUALITY,
-    'tiff': cv2.IMWRITE_TIFF_COMPRESSION,
-    'exr': cv2.IMWRITE_EXR_TYPE,
-}
-
 ImageWriteFlags = Literal['jpeg', 'png', 'webp', 'tiff', 'exr',]
+
+
+# Built on first access (PEP 562) so the type definitions can be imported
+# without paying for cv2.
+def _build_tables():
+    import cv2  # type: ignore
+    globals()['IMAGE_READ_FLAG_DICT'] = {
+        'unchanged': cv2.IMREAD_UNCHANGED,
+        'grayscale': cv2.IMREAD_GRAYSCALE,
+        'color': cv2.IMREAD_COLOR,
+        'anydepth': cv2.IMREAD_ANYDEPTH,
+        'anycolor': cv2.IMREAD_ANYCOLOR,
+        'load_gdal': cv2.IMREAD_LOAD_GDAL,
+        'ignore_orientation': cv2.IMREAD_IGNORE_ORIENTATION,
+        ('grayscale', 2): cv2.IMREAD_REDUCED_GRAYSCALE_2,
+        ('grayscale', 4): cv2.IMREAD_REDUCED_GRAYSCALE_4,
+        ('grayscale', 8): cv2.IMREAD_REDUCED_GRAYSCALE_8,
+        ('color', 2): cv2.IMREAD_REDUCED_COLOR_2,
+        ('color', 4): cv2.IMREAD_REDUCED_COLOR_4,
+        ('color', 8): cv2.IMREAD_REDUCED_COLOR_8,
+    }
+    globals()['IMAGE_WRITE_FLAG_DICT'] = {
+        'jpeg': cv2.IMWRITE_JPEG_QUALITY,
+        'png': cv2.IMWRITE_PNG_COMPRESSION,
+        'webp': cv2.IMWRITE_WEBP_QUALITY,
+        'tiff': cv2.IMWRITE_TIFF_COMPRESSION,
+        'exr': cv2.IMWRITE_EXR_TYPE,
+    }
+
+
+def __getattr__(name):
+    if name in ('IMAGE_READ_FLAG_DICT', 'IMAGE_WRITE_FLAG_DICT'):
+        _build_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
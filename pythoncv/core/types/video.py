@@ -1,14 +1,19 @@
-from typing import Literal
+import types
+from typing import Literal, get_args
 
-import cv2  # type: ignore
 from pydantic import (BaseModel, Field, confloat, conint, root_validator, validator)
 
-__all__ = [
+__all__ = [  # noqa: F822 -- the tables are provided lazily by __getattr__ (PEP 562)
     'VideoCaptureProperties',
     'VideoWriterProperties',
     'CAPTURE_BACKEND_DICT',
+    'CAPTURE_BACKENDS_SET',
     'CaptureBackends',
+    'HARDWARE_ACCELERATION_DICT',
+    'HardwareAccelerations',
     'FourCC',
+    'FOURCC_SET',
+    'fourcc_code',
 ]
 
 
@@ -96,40 +101,66 @@ class VideoWriterProperties(BaseModel):
             return v
 
 
-CAPTURE_BACKEND_DICT = {
-    'auto': cv2.CAP_ANY,
-    'vfw': cv2.CAP_VFW,
-    'v4l': cv2.CAP_V4L,
-    'v4l2': cv2.CAP_V4L2,
-    'firewire': cv2.CAP_FIREWIRE,
-    'firewire-1394': cv2.CAP_FIREWIRE,
-    'ieee1394': cv2.CAP_IEEE1394,
-    'dc1394': cv2.CAP_DC1394,
-    'cmu1394': cv2.CAP_CMU1394,
-    'quicktime': cv2.CAP_QT,
-    'unicap': cv2.CAP_UNICAP,
-    'd-show': cv2.CAP_DSHOW,
-    'pvapi': cv2.CAP_PVAPI,
-    'openni': cv2.CAP_OPENNI,
-    'openni-asus': cv2.CAP_OPENNI_ASUS,
-    'android': cv2.CAP_ANDROID,
-    'xiapi': cv2.CAP_XIAPI,
-    'avfoundation': cv2.CAP_AVFOUNDATION,
-    'giganetix': cv2.CAP_GIGANETIX,
-    'msmf': cv2.CAP_MSMF,
-    'winrt': cv2.CAP_WINRT,
-    'intel-perc': cv2.CAP_INTELPERC,
-    'openni2': cv2.CAP_OPENNI2,
-    'openni2-asus': cv2.CAP_OPENNI2_ASUS,
-    'gphoto2': cv2.CAP_GPHOTO2,
-    'gstreamer': cv2.CAP_GSTREAMER,
-    'ffmpeg': cv2.CAP_FFMPEG,
-    'images': cv2.CAP_IMAGES,
-    'aravis': cv2.CAP_ARAVIS,
-    'opencv-mjpeg': cv2.CAP_OPENCV_MJPEG,
-    'intel-mfx': cv2.CAP_INTEL_MFX,
-    'xine': cv2.CAP_XINE,
-}
+# The backend tables need cv2, which costs a few hundred milliseconds at
+# import. They are built on first access instead (PEP 562), so importing the
+# schema and Literal definitions alone never loads cv2. Both are read-only
+# views: importers get the O(1) lookups without being able to mutate shared
+# state that every reader open depends on.
+def _build_tables():
+    import cv2  # type: ignore
+    g = globals()
+    g['CAPTURE_BACKEND_DICT'] = types.MappingProxyType({
+        'auto': cv2.CAP_ANY,
+        'vfw': cv2.CAP_VFW,
+        'v4l': cv2.CAP_V4L,
+        'v4l2': cv2.CAP_V4L2,
+        'firewire': cv2.CAP_FIREWIRE,
+        'firewire-1394': cv2.CAP_FIREWIRE,
+        'ieee1394': cv2.CAP_IEEE1394,
+        'dc1394': cv2.CAP_DC1394,
+        'cmu1394': cv2.CAP_CMU1394,
+        'quicktime': cv2.CAP_QT,
+        'unicap': cv2.CAP_UNICAP,
+        'd-show': cv2.CAP_DSHOW,
+        'pvapi': cv2.CAP_PVAPI,
+        'openni': cv2.CAP_OPENNI,
+        'openni-asus': cv2.CAP_OPENNI_ASUS,
+        'android': cv2.CAP_ANDROID,
+        'xiapi': cv2.CAP_XIAPI,
+        'avfoundation': cv2.CAP_AVFOUNDATION,
+        'giganetix': cv2.CAP_GIGANETIX,
+        'msmf': cv2.CAP_MSMF,
+        'winrt': cv2.CAP_WINRT,
+        'intel-perc': cv2.CAP_INTELPERC,
+        'openni2': cv2.CAP_OPENNI2,
+        'openni2-asus': cv2.CAP_OPENNI2_ASUS,
+        'gphoto2': cv2.CAP_GPHOTO2,
+        'gstreamer': cv2.CAP_GSTREAMER,
+        'ffmpeg': cv2.CAP_FFMPEG,
+        'images': cv2.CAP_IMAGES,
+        'aravis': cv2.CAP_ARAVIS,
+        'opencv-mjpeg': cv2.CAP_OPENCV_MJPEG,
+        'intel-mfx': cv2.CAP_INTEL_MFX,
+        'xine': cv2.CAP_XINE,
+    })
+
+    g['HARDWARE_ACCELERATION_DICT'] = types.MappingProxyType({
+        'none': cv2.VIDEO_ACCELERATION_NONE,
+        'any': cv2.VIDEO_ACCELERATION_ANY,
+        'd3d11': cv2.VIDEO_ACCELERATION_D3D11,
+        'vaapi': cv2.VIDEO_ACCELERATION_VAAPI,
+        'mfx': cv2.VIDEO_ACCELERATION_MFX,
+    })
+
+
+def __getattr__(name):
+    if name in ('CAPTURE_BACKEND_DICT', 'HARDWARE_ACCELERATION_DICT'):
+        _build_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+HardwareAccelerations = Literal['none', 'any', 'd3d11', 'vaapi', 'mfx']
 
 CaptureBackends = Literal['auto', 'vfw', 'v4l', 'v4l2', 'firewire', 'firewire-1394', 'ieee1394', 'dc1394', 'cmu1394',
                           'quicktime', 'unicap', 'd-show', 'pvapi', 'openni', 'openni-asus', 'android', 'xiapi',
@@ -147,3 +178,34 @@ FourCC = Literal["1", "2", "2vuy", "4", "8", "8BPS", "16", "24", "24BG", "32", "
                  "v216", "v264", "v308", "v408", "v410", "VP30", "VP31", "VP50", "VP60", "VP70", "wmv1", "wmv2", "wmv3",
                  "x264", "xd5a", "xd59", "xdv1", "xdv2", "xdv3", "xdv4", "xdv5", "xdv6", "xdv7", "xdv8", "xdv9", "xdva",
                  "xplo", "y420", "yuvs", "zygo",]
+
+# Hashed membership for validation, like BORDER_TYPES_SET in .filter: checking
+# a user-supplied string against the Literal's get_args tuple is a linear scan
+# over 150+ entries for FourCC, a frozenset probe is O(1).
+CAPTURE_BACKENDS_SET = frozenset(get_args(CaptureBackends))
+FOURCC_SET = frozenset(get_args(FourCC))
+
+
+# cv2.VideoWriter_fourcc packs the four characters little-endian into an
+# int32; the same packing is done here once per known code so constructing a
+# writer is a dict probe instead of a cv2 call. Codes shorter than four
+# characters are space-padded, as cv2 expects.
+_FOURCC_CODES = types.MappingProxyType(
+    {code: int.from_bytes(code.ljust(4).encode('ascii'), 'little') for code in FOURCC_SET})
+
+
+def fourcc_code(fourcc: str) -> int:
+    """Pack a fourcc string into the int32 code cv2.VideoWriter expects.
+
+    Args:
+        fourcc: A fourcc code, e.g. "mp4v". Known codes resolve through a
+            precomputed table; codes outside the FourCC Literal (cv2 accepts
+            more than it enumerates) are packed on the fly.
+
+    Returns:
+        The packed little-endian code, equal to cv2.VideoWriter_fourcc(*fourcc).
+    """
+    code = _FOURCC_CODES.get(fourcc)
+    if code is None:
+        code = int.from_bytes(fourcc.ljust(4).encode('ascii')[:4], 'little')
+    return code
@@ -1,2 +1,8 @@
 from pythoncv.functions.blur import (bilateral_filter, blur, box_blur, gaussian_blur, median_blur, square_blur,
                                      stack_blur)
+from pythoncv.functions.filter2d import filter2d
+from pythoncv.functions.kernels import (get_deriv_kernels, get_gabor_kernel, get_gaussian_kernel,
+                                        get_structuring_element)
+from pythoncv.functions.morphology import dilation, erosion
+from pythoncv.functions.pyramid import build_pyramid, pyr_down, pyr_up
+from pythoncv.functions.tile import tile_apply
@@ -0,0 +1,57 @@
+""" CUDA filter dispatch.
+
+Private helpers backing the ``use_cuda`` flags on the filter functions. Everything
+here degrades gracefully on builds of OpenCV without CUDA support: ``cuda_available``
+answers False and the callers stay on the CPU path.
+
+cv2.cuda Filter objects are expensive to create (kernel upload, plan setup) but
+cheap to re-apply, so they are memoized by their construction parameters; the
+first successful availability check also enables OpenCV's GPU buffer pool so
+successive frames reuse the same pitched allocation instead of paying a
+cudaMalloc per call.
+
+"""
+import functools
+from typing import Tuple
+
+import cv2  # type: ignore
+import numpy as np
+
+
+@functools.lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """Whether this OpenCV build sees at least one CUDA device."""
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() <= 0:
+            return False
+        cv2.cuda.setBufferPoolUsage(True)
+        cv2.cuda.setBufferPoolConfig(cv2.cuda.getDevice(), 64 * 1024 * 1024, 2)
+        return True
+    except (AttributeError, cv2.error):
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _gaussian_filter(src_type: int, ksize: Tuple[int, int], sigma_x: float, sigma_y: float, border: int):
+    return cv2.cuda.createGaussianFilter(src_type, src_type, ksize, sigma_x, sigma_y, border, border)
+
+
+@functools.lru_cache(maxsize=32)
+def _linear_filter(src_type: int, kernel_bytes: bytes, kernel_shape: Tuple[int, int], anchor: Tuple[int, int],
+                   border: int):
+    kernel = np.frombuffer(kernel_bytes, dtype=np.float32).reshape(kernel_shape)
+    return cv2.cuda.createLinearFilter(src_type, src_type, kernel, anchor, border)
+
+
+def gaussian_blur(x: np.ndarray, ksize: Tuple[int, int], sigma_x: float, sigma_y: float, border: int) -> np.ndarray:
+    gpu = cv2.cuda.GpuMat()
+    gpu.upload(np.ascontiguousarray(x))
+    return _gaussian_filter(gpu.type(), ksize, sigma_x, sigma_y, border).apply(gpu).download()
+
+
+def filter2d(x: np.ndarray, kernel: np.ndarray, anchor: Tuple[int, int], border: int) -> np.ndarray:
+    gpu = cv2.cuda.GpuMat()
+    gpu.upload(np.ascontiguousarray(x))
+    kernel = np.ascontiguousarray(kernel, dtype=np.float32)
+    filter_ = _linear_filter(gpu.type(), kernel.tobytes(), kernel.shape, anchor, border)
+    return filter_.apply(gpu).download()
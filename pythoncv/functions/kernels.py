@@ -0,0 +1,152 @@
+""" Kernel construction utilities.
+
+This module contains helpers that build the small kernels consumed by the filter
+functions (derivative, Gaussian, Gabor and morphology structuring kernels).
+
+All builders are memoized: kernels are tiny, immutable and typically rebuilt with
+the same parameters on every frame of a pipeline, so repeated calls return the
+same cached ndarray. Cached kernels are marked read-only; copy one before
+mutating it.
+
+"""
+import functools
+from typing import Tuple
+
+import cv2  # type: ignore
+import numpy as np
+
+from pythoncv.core.types.filter import MORPH_SHAPES_DICT, MorphShapes
+
+
+def _read_only(kernel: np.ndarray) -> np.ndarray:
+    kernel.setflags(write=False)
+    return kernel
+
+
+@functools.lru_cache(maxsize=64)
+def get_deriv_kernels(
+    dx: int,
+    dy: int,
+    ksize: int = 3,
+    normalize: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """ Returns the filter coefficients for computing spatial image derivatives.
+
+    A single cv2.getDerivKernels call already yields both the row and the column
+    kernel, so this never round-trips to OpenCV twice.
+
+    Args:
+        dx: derivative order in the x direction.
+        dy: derivative order in the y direction.
+        ksize: aperture size; 1, 3, 5 or 7, or -1 for the 3x3 Scharr kernel.
+        normalize: whether to normalize the kernels so fixed-point bit shifts are preserved.
+
+    Returns:
+        A (kx, ky) tuple of 1-D float32 kernels for the x and y axes.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#ga6d6c23f7bd3f5836c31cfae994fc4aea)
+    """
+    kx, ky = cv2.getDerivKernels(dx, dy, ksize, normalize=normalize)
+    return _read_only(kx), _read_only(ky)
+
+
+# OpenCV's fixed coefficients for small default-sigma kernels, kept bit-exact.
+_SMALL_GAUSSIAN_TAB = {
+    1: (1.,),
+    3: (0.25, 0.5, 0.25),
+    5: (0.0625, 0.25, 0.375, 0.25, 0.0625),
+    7: (0.03125, 0.109375, 0.21875, 0.28125, 0.21875, 0.109375, 0.03125),
+    9: (4 / 256, 13 / 256, 30 / 256, 51 / 256, 60 / 256, 51 / 256, 30 / 256, 13 / 256, 4 / 256),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def get_gaussian_kernel(
+    ksize: int,
+    sigma: float = -1,
+) -> np.ndarray:
+    """ Returns Gaussian filter coefficients.
+
+    The kernel is built directly in NumPy (following cv2.getGaussianKernel's
+    rules, including its fixed small-kernel table) rather than marshalled
+    through a cv2 call: for a <64-element array the Python->C++ round trip
+    costs more than computing the coefficients.
+
+    Args:
+        ksize: aperture size. It should be odd and positive.
+        sigma:
+            Gaussian standard deviation.
+            If it is non-positive, it is computed from ksize as
+            ``sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8``.
+
+    Returns:
+        A (ksize, 1) float64 array of filter coefficients summing to 1.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#gac05a120c1ae92a6060dd0db190a61afa)
+    """
+    if sigma <= 0 and ksize in _SMALL_GAUSSIAN_TAB:
+        kernel = np.array(_SMALL_GAUSSIAN_TAB[ksize])
+    else:
+        if sigma <= 0:
+            sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+        offsets = np.arange(ksize, dtype=np.float64) - (ksize - 1) * 0.5
+        kernel = np.exp(-(offsets * offsets) / (2 * sigma * sigma))
+        kernel /= kernel.sum()
+    return _read_only(kernel.reshape(-1, 1))
+
+
+@functools.lru_cache(maxsize=64)
+def get_gabor_kernel(
+    ksize: Tuple[int, int],
+    sigma: float,
+    theta: float,
+    lambd: float,
+    gamma: float,
+    psi: float = np.pi * 0.5,
+) -> np.ndarray:
+    """ Returns Gabor filter coefficients.
+
+    Args:
+        ksize: size of the filter as (height, width).
+        sigma: standard deviation of the Gaussian envelope.
+        theta: orientation of the normal to the parallel stripes, in radians.
+        lambd: wavelength of the sinusoidal factor.
+        gamma: spatial aspect ratio.
+        psi: phase offset.
+
+    Returns:
+        A float64 array with the requested shape.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#gae84c92d248183bd92fa713ce51cc3599)
+    """
+    return _read_only(cv2.getGaborKernel((ksize[1], ksize[0]), sigma, theta, lambd, gamma, psi))
+
+
+@functools.lru_cache(maxsize=64)
+def get_structuring_element(
+    shape: MorphShapes,
+    ksize: Tuple[int, int],
+    anchor: Tuple[int, int] = (-1, -1),
+) -> np.ndarray:
+    """ Returns a structuring element for morphological operations.
+
+    Args:
+        shape: element shape ('rect', 'cross' or 'ellipse').
+        ksize: size of the structuring element as (height, width).
+        anchor: anchor position within the element. (-1, -1) means the center.
+
+    Returns:
+        A uint8 array with the requested shape.
+
+    Raises:
+        ValueError: If shape is not a known element shape.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#gac342a1bb6eabf6f55c803b09268e36dc)
+    """
+    if shape not in MORPH_SHAPES_DICT:
+        raise ValueError(f"Invalid structuring element shape: {shape}")
+    return _read_only(cv2.getStructuringElement(MORPH_SHAPES_DICT[shape], (ksize[1], ksize[0]), anchor))
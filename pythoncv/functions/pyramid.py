@@ -0,0 +1,127 @@
+""" Image pyramid functions.
+
+This module contains functions for building Gaussian image pyramids.
+
+Notes:
+    Image in pythoncv shoule be a numpy.ndarray object, which has the shape of (height, width, channel).
+    No matter what the order of the channel is.
+
+"""
+from typing import List, Optional, Tuple, Union
+
+import cv2  # type: ignore
+import numpy as np
+
+from pythoncv.core.types.filter import BorderTypes, resolve_border_type
+
+
+def pyr_down(
+    x: np.ndarray,
+    dst_size: Optional[Tuple[int, int]] = None,
+    border_type: Union[BorderTypes, int] = "reflect101",
+) -> np.ndarray:
+    """ Blurs an image and downsamples it.
+
+    The function convolves the source image with a 5x5 Gaussian kernel and then
+    downsamples it by rejecting even rows and columns.
+
+    Args:
+        x: input image.
+        dst_size:
+            size of the output image as (height, width).
+            Defaults to ((height + 1) // 2, (width + 1) // 2).
+        border_type: border mode used to extrapolate pixels outside the image.
+
+    Returns:
+        The blurred and downsampled image.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#gaf9bba239dfca11654cb7f50f889fc2ff)
+    """
+    border_type = resolve_border_type(border_type)
+    if dst_size is not None:
+        dst_size = (dst_size[1], dst_size[0])
+    return cv2.pyrDown(x, dstsize=dst_size, borderType=border_type)
+
+
+def pyr_up(
+    x: np.ndarray,
+    dst_size: Optional[Tuple[int, int]] = None,
+    border_type: Union[BorderTypes, int] = "reflect101",
+) -> np.ndarray:
+    """ Upsamples an image and then blurs it.
+
+    The function upsamples the source image by injecting even zero rows and columns and
+    then convolves the result with the same 5x5 Gaussian kernel as `pyr_down` multiplied by 4.
+
+    Args:
+        x: input image.
+        dst_size: size of the output image as (height, width). Defaults to (height * 2, width * 2).
+        border_type: border mode used to extrapolate pixels outside the image.
+
+    Returns:
+        The upsampled and blurred image.
+
+    See Also:
+        [OpenCV Doc](https://docs.opencv.org/4.x/d4/d86/group__imgproc__filter.html#gada75b59bdaaca411ed6fee10085eb784)
+    """
+    border_type = resolve_border_type(border_type)
+    if dst_size is not None:
+        dst_size = (dst_size[1], dst_size[0])
+    return cv2.pyrUp(x, dstsize=dst_size, borderType=border_type)
+
+
+def build_pyramid(
+    x: np.ndarray,
+    max_level: int,
+    border_type: Union[BorderTypes, int] = "reflect101",
+) -> List[np.ndarray]:
+    """ Builds a Gaussian pyramid for an image.
+
+    The pyramid is built with a flat iterative loop: the border flag is resolved once
+    before the loop and each level is appended to a single result list, so the cost is
+    one `pyr_down` per level with no recursion depth or repeated list concatenation.
+
+    All downsampled levels live in one contiguous scratch allocation (their total size
+    is bounded by 1/3 of the input), and each `cv2.pyrDown` writes straight into its
+    slice. Per-frame pyramids therefore cost a single heap allocation, and the small
+    upper levels stay adjacent in memory instead of being scattered by the allocator.
+
+    Args:
+        x: input image. This becomes level 0 of the pyramid.
+        max_level: number of downsampling steps. The result has max_level + 1 levels.
+        border_type: border mode used to extrapolate pixels outside the image.
+
+    Returns:
+        A list of images, from the original (level 0) down to the smallest level.
+
+    Raises:
+        ValueError: If max_level is negative.
+
+    Examples:
+        >>> pyramid = build_pyramid(image, max_level=3)
+        >>> [level.shape[0] for level in pyramid]
+        [1080, 540, 270, 135]
+    """
+    if max_level < 0:
+        raise ValueError(f"max_level must be non-negative, not {max_level}")
+
+    border_type = resolve_border_type(border_type)
+
+    shapes = []
+    height, width = x.shape[:2]
+    for _ in range(max_level):
+        height, width = (height + 1) // 2, (width + 1) // 2
+        shapes.append((height, width) + x.shape[2:])
+
+    scratch = np.empty(sum(int(np.prod(shape)) for shape in shapes), dtype=x.dtype)
+
+    pyramid = [x]
+    offset = 0
+    for shape in shapes:
+        size = int(np.prod(shape))
+        level = scratch[offset:offset + size].reshape(shape)
+        cv2.pyrDown(pyramid[-1], dst=level, borderType=border_type)
+        pyramid.append(level)
+        offset += size
+    return pyramid
@@ -1,9 +1,19 @@
 """ PythonCV IO module.
+
+Submodule imports are deferred (PEP 562): importing ``pythoncv.io`` itself is
+nearly free, and the video/image machinery (which pulls in OpenCV's capture and
+codec probing) is only loaded when one of its names is first used. Filter-only
+workloads never pay for IO start-up this way.
 """
+import importlib
+import os
+from typing import TYPE_CHECKING
 
-from .image import (read_image, read_image_from_bytes, read_image_from_file, write_image_to_bytes, write_image_to_file)
-from .video import (BaseVideoWriter, VideoReader, VideoWriter, read_video_from_device, read_video_from_file,
-                    read_video_from_url)
+if TYPE_CHECKING:
+    from .image import (read_image, read_image_from_bytes, read_image_from_file, read_images, write_image_to_bytes,
+                        write_image_to_file, write_images)
+    from .video import (BaseVideoWriter, VideoReader, VideoWriter, read_video_from_device, read_video_from_file,
+                        read_video_from_url, read_video_to_ndarray)
 
 __all__ = [
     'VideoReader',
@@ -12,11 +22,73 @@ __all__ = [
     'read_video_from_device',
     'read_video_from_file',
     'read_video_from_url',
+    'read_video_to_ndarray',
     'read_image_from_file',
     'read_image_from_bytes',
     'read_image',
+    'read_images',
     'write_image_to_file',
     'write_image_to_bytes',
+    'write_images',
+    'set_num_threads',
     'video',
     'image',
 ]
+
+
+def set_num_threads(n: int) -> None:
+    """Cap the number of threads OpenCV's internal pool may use.
+
+    The pool is shared process-wide and defaults to every core, which
+    oversubscribes the CPU as soon as pythoncv work runs next to its own
+    reader/compute threads (or another library's pool). Setting this lets a
+    pipeline budget cores explicitly; ``n=0`` disables OpenCV threading and
+    ``n<0`` restores the default. Honoured at import time through the
+    ``PYTHONCV_NUM_THREADS`` environment variable as well.
+
+    See Also:
+        https://docs.opencv.org/4.x/db/de0/group__core__utils.html#gae78625c3c2aa9e0b83ed31b73c6549c0
+    """
+    import cv2  # type: ignore
+    cv2.setNumThreads(int(n))
+
+
+# Only touches cv2 when the variable is set, so plain imports keep the lazy
+# start-up this package header promises.
+_env_num_threads = os.environ.get('PYTHONCV_NUM_THREADS')
+if _env_num_threads:
+    set_num_threads(int(_env_num_threads))
+del _env_num_threads
+
+_ATTR_MODULES = {
+    'VideoReader': 'video',
+    'BaseVideoWriter': 'video',
+    'VideoWriter': 'video',
+    'read_video_from_device': 'video',
+    'read_video_from_file': 'video',
+    'read_video_from_url': 'video',
+    'read_video_to_ndarray': 'video',
+    'read_image_from_file': 'image',
+    'read_image_from_bytes': 'image',
+    'read_image': 'image',
+    'read_images': 'image',
+    'write_image_to_file': 'image',
+    'write_image_to_bytes': 'image',
+    'write_images': 'image',
+}
+
+
+def __getattr__(name):
+    if name in ('video', 'image', 'display'):
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _ATTR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so __getattr__ runs at most once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
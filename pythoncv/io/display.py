@@ -27,8 +27,25 @@ class VideoWindow(BaseVideoWriter):
         if self._is_open:
             warnings.warn("VideoWindow is already open")
             return
-        cv2.namedWindow(self.name, WINDOW_FLAGS_DICT[self._type])
+        if self._type is None:
+            # OpenGL-backed windows hand imshow's ndarray straight to a GL
+            # texture instead of staging a second CPU surface, which is the
+            # dominant cost at 1080p and above. Not every cv2 wheel is built
+            # with OpenGL support, so fall back to a plain autosize window.
+            try:
+                cv2.namedWindow(self.name, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+            except cv2.error:
+                cv2.namedWindow(self.name, cv2.WINDOW_AUTOSIZE)
+        else:
+            cv2.namedWindow(self.name, WINDOW_FLAGS_DICT[self._type])
         cv2.resizeWindow(self.name, self._size[0], self._size[1])
+        try:
+            # VSYNC caps ``write`` at the monitor refresh rate; playback pacing
+            # belongs to the caller, so default it off. Non-OpenGL windows on
+            # some platforms reject the property; that fallback is silent.
+            cv2.setWindowProperty(self.name, cv2.WND_PROP_VSYNC, 0)
+        except cv2.error:
+            pass
         self._is_open = True
 
     def close(self):
@@ -110,7 +127,14 @@ class VideoWindow(BaseVideoWriter):
         if not self._is_open:
             raise RuntimeError("VideoWindow is not open")
         cv2.imshow(self.name, frame)
-        cv2.waitKey(1)
+        # pollKey pumps the GUI event loop without waitKey's ~1-15 ms sleep
+        # (the sleep quantum depends on the OS scheduler), which otherwise
+        # dominates per-frame time at high display rates.
+        poll_key = getattr(cv2, 'pollKey', None)
+        if poll_key is not None:
+            poll_key()
+        else:
+            cv2.waitKey(1)
 
     def __del__(self):
         self.close()
@@ -1,6 +1,9 @@
+import functools
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional, Tuple, Union
+from typing import List, Literal, Optional, Sequence, Tuple, Union
 
 import cv2  # type: ignore
 import numpy as np
@@ -8,12 +11,99 @@ import numpy as np
 from pythoncv.core.types import (IMAGE_READ_FLAG_DICT, IMAGE_WRITE_FLAG_DICT, ImageReadFlags, ImageWriteFlags)
 from pythoncv.core import CVImage
 
+# cv2 entry points bound at import: these run once per image, and binding them
+# as module locals drops the LOAD_GLOBAL cv2 + LOAD_ATTR pair from each call.
+_imread = cv2.imread
+_imdecode = cv2.imdecode
+_imwrite = cv2.imwrite
+_imencode = cv2.imencode
+
+# Optional accelerated JPEG path (install with the 'turbojpeg' extra).
+# libjpeg-turbo's SIMD decoder is severalfold faster than the libjpeg many
+# opencv wheels bundle, and it can emit RGB directly, so the post-decode
+# channel swap disappears too. Everything falls back to cv2.imdecode when the
+# package or the native library is absent.
+try:
+    from turbojpeg import TJPF_GRAY, TJPF_RGB, TurboJPEG  # type: ignore
+    try:
+        _turbo_jpeg: Optional['TurboJPEG'] = TurboJPEG()
+    except (OSError, RuntimeError):  # package installed, native lib missing
+        _turbo_jpeg = None
+except ImportError:
+    _turbo_jpeg = None
+
+
+def _decode_jpeg_turbo(
+    b: Union[bytes, bytearray, memoryview, mmap.mmap],
+    color_mode: ImageReadFlags,
+    reduce_ratio: Literal[None, 2, 4, 8],
+) -> Optional[np.ndarray]:
+    """Decode JPEG data with libjpeg-turbo, or return None to use cv2 instead.
+
+    Only JPEG input qualifies (checked via the ff d8 magic); the reduce ratio
+    maps onto turbojpeg's native 1/2, 1/4, 1/8 scaling, which happens during
+    the IDCT for free. Grayscale decodes straight to single-channel, color
+    decodes straight to RGB. 'unchanged' always goes to cv2: its output shape
+    depends on the source's own colorspace (a grayscale JPEG must come back
+    (H, W)), which a fixed turbo pixel format cannot honor. Any decode error
+    also falls back to cv2 so the two paths raise identically on bad data.
+    """
+    if _turbo_jpeg is None or color_mode not in ('color', 'grayscale'):
+        return None
+    if bytes(memoryview(b)[:2]) != b'\xff\xd8':
+        return None
+    pixel_format = TJPF_GRAY if color_mode == 'grayscale' else TJPF_RGB
+    scaling_factor = (1, reduce_ratio) if reduce_ratio is not None else (1, 1)
+    try:
+        result = _turbo_jpeg.decode(b, pixel_format=pixel_format, scaling_factor=scaling_factor)
+    except (OSError, ValueError):
+        return None
+    if result.ndim == 3 and result.shape[2] == 1:
+        result = result[:, :, 0]
+    return result
+
+
+def _bgr_to_rgb(result: np.ndarray) -> np.ndarray:
+    """Swap a freshly decoded image to RGB order, in place.
 
+    cv2.cvtColor with dst=result swaps the channels in a single SIMD pass over
+    the buffer we already own, so the returned image stays C-contiguous and
+    downstream consumers never pay the hidden copy a reversed-stride view
+    (``[..., ::-1]``) would force on them. Single-channel images pass through
+    untouched (reversing their last axis would mirror them horizontally).
+    """
+    if result.ndim == 3:
+        code = cv2.COLOR_BGRA2RGBA if result.shape[2] == 4 else cv2.COLOR_BGR2RGB
+        result = cv2.cvtColor(result, code, dst=result)
+    return result
+
+
+def _rgb_to_bgr(image: np.ndarray) -> np.ndarray:
+    """Return the image in the BGR order the cv2 encoders expect.
+
+    When the input is itself a reversed view over a contiguous BGR buffer (the
+    layout our video reader hands out), reversing again yields the base for
+    free. Any other 3/4-channel layout gets one explicit cvtColor pass, which
+    beats the slower internal copy cv2 makes from negative-stride input.
+    """
+    if image.ndim != 3:
+        return image
+    swapped = image[..., ::-1]
+    if swapped.flags['C_CONTIGUOUS']:
+        return swapped
+    code = cv2.COLOR_RGBA2BGRA if image.shape[2] == 4 else cv2.COLOR_RGB2BGR
+    return cv2.cvtColor(image, code)
+
+
+# Every read pays this lookup; the argument space is tiny and hashable, so an
+# LRU cache collapses it to a single dict probe in steady state.
+@functools.lru_cache(maxsize=32)
 def _image_read_flag_wrapper(
     color_mode: ImageReadFlags,
     reduce_ratio: Literal[None, 2, 4, 8] = None,
 ) -> int:
-    assert color_mode in IMAGE_READ_FLAG_DICT, AttributeError(f"Invalid color_mode {color_mode}")
+    if color_mode not in IMAGE_READ_FLAG_DICT:
+        raise AttributeError(f"Invalid color_mode {color_mode}")
 
     flag = IMAGE_READ_FLAG_DICT[color_mode]
     if reduce_ratio is not None:
@@ -28,6 +118,8 @@ def read_image_from_file(
     filename: Union[str, Path],
     color_mode: ImageReadFlags = 'unchanged',
     reduce_ratio: Literal[None, 2, 4, 8] = None,
+    out: Optional[np.ndarray] = None,
+    use_umat: bool = False,
 ) -> CVImage:
     """Read image from file.
 
@@ -35,10 +127,21 @@ def read_image_from_file(
         filename: Path to the image
         color_mode: Color mode of the image (e.g. 'grayscale', 'color', 'unchanged', default is 'unchanged')
         reduce_ratio: Reduce ratio of the image (only None, 2, 4, 8 are valid, default is None, meaning no reduction)
+        out:
+            Optional preallocated destination with the decoded image's shape and
+            dtype. The RGB result is written straight into it, which lets callers
+            reuse one aligned buffer across many reads (or decode into memory
+            shared with another library) without a copy per image.
+        use_umat:
+            If True, return a cv2.UMat instead of an ndarray. On OpenCL-capable
+            builds the channel swap then runs on the GPU and the image stays
+            device-resident for any following cv2 calls, skipping one full CPU
+            memory pass per step; without OpenCL the UMat transparently wraps
+            host memory. Call ``.get()`` to materialize an ndarray.
 
     Returns:
         Image as a numpy array. (H, W, C) and dtype uint8, Channel order is RGB.
-        If the image is grayscale, the shape is (H, W).
+        The array is always C-contiguous. If the image is grayscale, the shape is (H, W).
 
     Raises:
         AttributeError: If the image cannot be read
@@ -54,20 +157,47 @@ def read_image_from_file(
     """
     flag = _image_read_flag_wrapper(color_mode, reduce_ratio)
 
-    result = cv2.imread(str(filename), flag)
-    assert result is not None, AttributeError(f"Failed to read image from {os.path.abspath(filename)}")
-    return result[..., ::-1].view(CVImage)
+    if _turbo_jpeg is not None and out is None and not use_umat:
+        # mmap hands the decoder a zero-copy view of the page cache; no bytes
+        # object the size of the file is ever materialized.
+        try:
+            with open(filename, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    result = _decode_jpeg_turbo(m, color_mode, reduce_ratio)
+        except (OSError, ValueError):
+            result = None
+        if result is not None:
+            return result.view(CVImage)
+
+    result = _imread(str(filename), flag)
+    if result is None:
+        raise AttributeError(f"Failed to read image from {os.path.abspath(filename)}")
+    if use_umat:
+        umat = cv2.UMat(result)
+        if result.ndim == 3:
+            code = cv2.COLOR_BGRA2RGBA if result.shape[2] == 4 else cv2.COLOR_BGR2RGB
+            umat = cv2.cvtColor(umat, code)
+        return umat
+    if out is not None:
+        if result.ndim == 3:
+            code = cv2.COLOR_BGRA2RGBA if result.shape[2] == 4 else cv2.COLOR_BGR2RGB
+            cv2.cvtColor(result, code, dst=out)
+        else:
+            np.copyto(out, result)
+        return out.view(CVImage)
+    return _bgr_to_rgb(result).view(CVImage)
 
 
 def read_image_from_bytes(
-    b: bytes,
+    b: Union[bytes, bytearray, memoryview],
     color_mode: ImageReadFlags = 'unchanged',
     reduce_ratio: Literal[None, 2, 4, 8] = None,
 ) -> CVImage:
     """Read image from bytes.
 
     Args:
-        b: Bytes of the image
+        b: Encoded image data. Any buffer-protocol object (bytes, bytearray,
+            memoryview, mmap) is accepted and wrapped without copying.
         color_mode: Color mode of the image
         reduce_ratio: Reduce ratio of the image
 
@@ -87,13 +217,22 @@ def read_image_from_bytes(
         https://docs.opencv.org/4.x/d4/da8/group__imgcodecs.html#ga26a67788faa58ade337f8d28ba0eb19e
     """
     flag = _image_read_flag_wrapper(color_mode, reduce_ratio)
-    result = cv2.imdecode(np.frombuffer(b, np.uint8), flag)
-    assert result is not None, AttributeError("Failed to read image from bytes")
-    return result[..., ::-1].view(CVImage)
-
-
+    result = _decode_jpeg_turbo(b, color_mode, reduce_ratio)
+    if result is not None:
+        return result.view(CVImage)
+    # np.frombuffer wraps the caller's buffer without copying (unlike bytes(...)
+    # or np.fromstring), so the only allocation here is the decoded image itself.
+    result = _imdecode(np.frombuffer(b, np.uint8), flag)
+    if result is None:
+        raise AttributeError("Failed to read image from bytes")
+    return _bgr_to_rgb(result).view(CVImage)
+
+
+# singledispatch resolves the input type through one C-level cache lookup
+# instead of an isinstance chain that grows with every accepted input type.
+@functools.singledispatch
 def read_image(
-    image: Union[bytes, str, Path],
+    image: Union[bytes, bytearray, memoryview, str, Path],
     color_mode: ImageReadFlags = 'unchanged',
     reduce_ratio: Literal[None, 2, 4, 8] = None,
 ) -> CVImage:
@@ -122,12 +261,59 @@ def read_image(
 
         https://docs.opencv.org/4.x/d4/da8/group__imgcodecs.html#ga26a67788faa58ade337f8d28ba0eb19e
     """
-    if isinstance(image, bytes):
-        return read_image_from_bytes(image, color_mode, reduce_ratio)
-    else:
-        return read_image_from_file(image, color_mode, reduce_ratio)
+    # Base case covers str, Path, and any other path-like input.
+    return read_image_from_file(image, color_mode, reduce_ratio)
+
+
+@read_image.register(bytes)
+@read_image.register(bytearray)
+@read_image.register(memoryview)
+def _read_image_from_buffer(
+    image: Union[bytes, bytearray, memoryview],
+    color_mode: ImageReadFlags = 'unchanged',
+    reduce_ratio: Literal[None, 2, 4, 8] = None,
+) -> CVImage:
+    return read_image_from_bytes(image, color_mode, reduce_ratio)
+
+
+def read_images(
+    paths: Sequence[Union[str, Path]],
+    color_mode: ImageReadFlags = 'unchanged',
+    reduce_ratio: Literal[None, 2, 4, 8] = None,
+    max_workers: Optional[int] = None,
+) -> List[CVImage]:
+    """Read a batch of image files concurrently.
+
+    Sequential reads serialize disk stalls and libjpeg/libpng decode time.
+    Both release the GIL, so a thread pool genuinely overlaps them and keeps
+    every core decoding.
+
+    Args:
+        paths: Paths of the images to read.
+        color_mode: Color mode applied to every image.
+        reduce_ratio: Reduce ratio applied to every image.
+        max_workers: Pool size. Defaults to min(32, number of paths, cpu count).
 
+    Returns:
+        Decoded images in the same order as ``paths``.
+
+    Raises:
+        AttributeError: If any image cannot be read.
 
+    Examples:
+        >>> from pythoncv.io import read_images
+        >>> images = read_images(['a.jpg', 'b.jpg', 'c.jpg'])
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    if max_workers is None:
+        max_workers = min(32, len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: read_image_from_file(path, color_mode, reduce_ratio), paths))
+
+
+@functools.lru_cache(maxsize=32)
 def _image_write_flag_wrapper(
     type: Optional[ImageWriteFlags] = None,
     quality: Union[None, int, float] = None,
@@ -135,7 +321,8 @@ def _image_write_flag_wrapper(
     if type is None:
         return None
     else:
-        assert type in IMAGE_WRITE_FLAG_DICT, AttributeError(f"Invalid image type {type}")
+        if type not in IMAGE_WRITE_FLAG_DICT:
+            raise AttributeError(f"Invalid image type {type}")
 
     flag: int = IMAGE_WRITE_FLAG_DICT[type]
     if type in ['webp', 'jpeg']:
@@ -175,8 +362,53 @@ def write_image_to_file(
         flag = _image_write_flag_wrapper(type, quality)
     else:
         flag = None
-    result = cv2.imwrite(str(filename), image[..., ::-1], flag)
-    assert result, AttributeError(f"Failed to write image to {os.path.abspath(filename)}")
+    result = _imwrite(str(filename), _rgb_to_bgr(image), flag)
+    if not result:
+        raise AttributeError(f"Failed to write image to {os.path.abspath(filename)}")
+
+
+def write_images(
+    images: Sequence[np.ndarray],
+    paths: Sequence[Union[str, Path]],
+    *,
+    type: Optional[ImageWriteFlags] = None,
+    quality: int = 95,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Write a batch of images to files concurrently.
+
+    Sequential writes serialize the JPEG/PNG encode and the disk flush.
+    Both release the GIL, so a thread pool overlaps encoding one image with
+    writing the previous one to disk, the same way ``read_images`` overlaps
+    decode with IO.
+
+    Args:
+        images: Images to write, matched to ``paths`` by position.
+        paths: Destination path for each image.
+        type: Encoder applied to every image (None infers it per filename).
+        quality: Quality applied to every image (only valid for JPEG/WebP).
+        max_workers: Pool size. Defaults to min(32, number of images, cpu count).
+
+    Raises:
+        ValueError: If ``images`` and ``paths`` differ in length.
+        AttributeError: If any image cannot be written.
+
+    Examples:
+        >>> from pythoncv.io import write_images
+        >>> write_images([image_a, image_b], ['a.jpg', 'b.jpg'], type='jpeg')
+    """
+    images = list(images)
+    paths = list(paths)
+    if len(images) != len(paths):
+        raise ValueError(f"images and paths must have the same length, got {len(images)} and {len(paths)}")
+    if not images:
+        return
+    if max_workers is None:
+        max_workers = min(32, len(images), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() drains the iterator so any encode/write failure re-raises here.
+        list(executor.map(lambda args: write_image_to_file(args[0], args[1], type=type, quality=quality),
+                          zip(images, paths)))
 
 
 def write_image_to_bytes(
@@ -205,6 +437,7 @@ def write_image_to_bytes(
         https://docs.opencv.org/3.4/d4/da8/group__imgcodecs.html#ga461f9ac09887e47797a54567df3b8b63
     """
     flag = _image_write_flag_wrapper(type, quality)
-    ret, result = cv2.imencode('.jpg', image[..., ::-1], flag)
-    assert ret, AttributeError("Failed to write image to bytes")
+    ret, result = _imencode('.jpg', _rgb_to_bgr(image), flag)
+    if not ret:
+        raise AttributeError("Failed to write image to bytes")
     return result.tobytes()
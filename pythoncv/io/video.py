@@ -1,20 +1,133 @@
 import os
+import queue
+import threading
+import types
+import warnings
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import Iterator, Literal, Optional, Tuple, Union
 
 import cv2  # type: ignore
 import numpy as np
 
 from pythoncv.core.io import CVVideo, CVImage
-from pythoncv.core.types import (CAPTURE_BACKEND_DICT, CaptureBackends, FourCC, VideoCaptureProperties,
-                                 VideoWriterProperties)
+from pythoncv.core.types import (CAPTURE_BACKEND_DICT, CAPTURE_BACKENDS_SET, HARDWARE_ACCELERATION_DICT,
+                                 CaptureBackends, FourCC, HardwareAccelerations, VideoCaptureProperties,
+                                 VideoWriterProperties, fourcc_code)
+
+# cv2 attributes touched once per frame (or per property read), bound at import
+# so the hot paths skip the LOAD_GLOBAL cv2 + LOAD_ATTR pair on every call.
+_CAP_PROP_FPS = cv2.CAP_PROP_FPS
+_CAP_PROP_FRAME_COUNT = cv2.CAP_PROP_FRAME_COUNT
+_CAP_PROP_BUFFERSIZE = cv2.CAP_PROP_BUFFERSIZE
+_CAP_PROP_POS_FRAMES = cv2.CAP_PROP_POS_FRAMES
+
+# Forward gaps up to this many frames are bridged with grab() (container
+# advance, no decode) instead of a positional seek: a seek lands on the
+# nearest prior keyframe and re-decodes forward from there, which for close
+# targets costs more than just grabbing through the gap.
+_SEEK_THRESHOLD = 256
+# fourcc codes are bit-packed from 4-char strings; writers opened in a loop
+# (one per shot/segment) reuse the packed integer instead of re-encoding it.
+_COLOR_RGB2BGR = cv2.COLOR_RGB2BGR
+_COLOR_BGR2RGB = cv2.COLOR_BGR2RGB
+_cvt_color = cv2.cvtColor
+
+
+def _make_info_property(name: str, prop_id: int, cast: type, unset_sentinel: bool):
+    """Build one property descriptor wrapping handle.get/set for one cv2 property.
+
+    The proxy's only job is shuttling a number between Python and cap.get/set,
+    so the descriptor talks to the handle directly instead of round-tripping
+    through a pydantic model (whose assignment validation costs two orders of
+    magnitude more than the lookup itself). The model's useful behaviour is
+    reproduced statically: values are coerced to the field's declared type, and
+    fields whose lower bound is -1 (frame_count, n_frames) map that backend
+    sentinel to None.
+    """
+
+    def getter(self):
+        value = self._handle.get(prop_id)
+        if unset_sentinel and value == -1:
+            return None
+        return cast(value)
+
+    def setter(self, value):
+        if not self._handle.set(prop_id, value):
+            raise RuntimeError(f'Failed to set {name} to {value}')
+
+    return property(getter, setter)
+
+
+def _make_info_proxy_class(model_cls, repr_fn):
+    """Build (once, at import) a slotted proxy class for a properties model.
+
+    The previous implementation created a fresh ``type(...)`` per reader/writer
+    instance and intercepted every attribute access through ``__getattribute__``
+    with a ``__fields__`` dict probe plus a ``getattr(cv2, alias)`` lookup.
+    A single class with per-field property descriptors does the same job with
+    one C-level descriptor dispatch per access; the pydantic model is consulted
+    only here, as the schema the descriptors are generated from.
+    """
+    namespace = {
+        '__slots__': ('_handle',),
+        '__doc__': model_cls.__doc__,
+        '__repr__': repr_fn,
+    }
+
+    def __init__(self, handle):
+        self._handle = handle
+
+    def update(self, **values):
+        """Set several properties in one call.
+
+        The field-name -> cv2 prop-id table is resolved once when the proxy
+        class is built, so a bulk sync is one handle.set per property with no
+        per-field descriptor or alias lookup in between.
+
+        Raises:
+            KeyError: If a keyword does not name a known property.
+            RuntimeError: If the backend rejects a value.
+        """
+        handle = self._handle
+        prop_ids = self._prop_ids
+        for name, value in values.items():
+            if not handle.set(prop_ids[name], value):
+                raise RuntimeError(f'Failed to set {name} to {value}')
+
+    namespace['__init__'] = __init__
+    namespace['update'] = update
+    prop_ids = {}
+    for name, field in model_cls.__fields__.items():
+        # ge=/le= constraints make pydantic wrap the declared type (e.g.
+        # ConstrainedIntValue), so resolve the builtin via subclass check.
+        cast = int if issubclass(field.outer_type_, int) else float
+        unset_sentinel = getattr(field.field_info, 'ge', None) == -1
+        prop_ids[name] = getattr(cv2, field.alias)
+        namespace[name] = _make_info_property(name, prop_ids[name], cast, unset_sentinel)
+    namespace['_prop_ids'] = types.MappingProxyType(prop_ids)
+    return type(model_cls.__name__, (object,), namespace)
+
+
+def _capture_info_repr(self):
+    return str(f"VideoCaptureProperties("
+               f"fps: {self.fps}, width: {self.frame_width}, height: {self.frame_height}, "
+               f"frame_count: {self.frame_count})")
+
+
+def _writer_info_repr(self):
+    return str(f"VideoWriterProperties("
+               f"quality={self.quality}, n_frames={self.n_frames}, frame_bytes={self.frame_bytes})")
+
+
+_CaptureInfoProxy = _make_info_proxy_class(VideoCaptureProperties, _capture_info_repr)
+_WriterInfoProxy = _make_info_proxy_class(VideoWriterProperties, _writer_info_repr)
 
 
 def _generate_capture_info_wrapper(cap: cv2.VideoCapture):
     """Captures the properties of the VideoCapture object.
 
-    Generates a wrapper, which make a fake VideoCaptureProperties object, which can be used to get and set
-    properties of the VideoCapture object.
+    Returns a proxy whose attributes get and set the corresponding properties of
+    the VideoCapture object directly.
 
     Args:
         cap: VideoCapture object
@@ -22,37 +135,7 @@ def _generate_capture_info_wrapper(cap: cv2.VideoCapture):
     Returns:
         A wrapper object, which can be used to get and set properties of the VideoCapture object.
     """
-    properties = VideoCaptureProperties()  # type: ignore
-
-    def __getattribute__(self, item):
-        if item in properties.__fields__.keys():
-            setattr(properties, item, cap.get(getattr(cv2, properties.__fields__[item].alias)))
-            return getattr(properties, item)
-        else:
-            raise AttributeError(f'{properties.__class__.__name__} has no attribute {item}')
-
-    def __setattr__(self, key, value):
-        if key in properties.__fields__.keys():
-            setattr(properties, key, value)
-            if cap.set(getattr(cv2, properties.__fields__[key].alias), getattr(properties, key)):
-                return
-            else:
-                raise RuntimeError(f'Failed to set {key} to {value}')
-        else:
-            raise AttributeError(f'{properties.__class__.__name__} has no attribute {key}')
-
-    def __repr__(self: VideoCaptureProperties):
-        return str(f"VideoCaptureProperties("
-                   f"fps: {self.fps}, width: {self.frame_width}, height: {self.frame_height}, "
-                   f"frame_count: {self.frame_count})")
-
-    return type(
-        'VideoCaptureProperties', (object,), {
-            '__doc__': VideoCaptureProperties.__doc__,
-            '__getattribute__': __getattribute__,
-            '__setattr__': __setattr__,
-            '__repr__': __repr__,
-        })()
+    return _CaptureInfoProxy(cap)
 
 
 class VideoReader(CVVideo):
@@ -73,11 +156,23 @@ class VideoReader(CVVideo):
             If backend is "ffmpeg", the backend will be ffmpeg.
             If backend is "gstreamer", the backend will be gstreamer.
             other backend types can be found in `pythoncv.types.CaptureBackends``
+        channel_order:
+            Channel order of the yielded frames. "rgb" (default) returns a reversed
+            view over the decoded buffer; "bgr" returns the decoded buffer untouched,
+            which is the cheapest option when frames go straight back into OpenCV.
+        reuse_buffer:
+            If True, every iteration decodes into the same retained frame buffer
+            instead of allocating a new one, which removes the per-frame allocator
+            churn on high-resolution streams. Each yielded frame then aliases the
+            previous one: call ``.copy()`` on any frame kept across iterations.
 
     Attributes:
         path: Path to the video. If the video is read from a device, the path will be the device number.
         fps: Frames per second. When you set the fps, the wait_time will be changed automatically.
         wait_time: Time to wait between each frame.
+        stride:
+            Number of source frames advanced per iteration.
+            Frames skipped by the stride are only grabbed (container advance), never decoded.
         info:
             VideoCaptureProperties object, which can be used to get and set properties of the VideoCapture object.
             Some properties may not be supported by the backend.
@@ -91,23 +186,49 @@ class VideoReader(CVVideo):
             If the video is read from a device(which has unlimited length), the length will be set to None.
     """
 
+    # Readers are opened in bulk by dataset scans; slots shave the per-instance
+    # dict allocation and turn attribute access into fixed-offset loads.
+    __slots__ = ('_cap', 'path', '_stride', '_channel_order', '_reuse_buffer', '_frame_buf', '_info', '_wait_time')
+
     def __init__(
         self,
         path: Union[str, int],
         backend: CaptureBackends = "auto",
+        stride: int = 1,
+        hardware_acceleration: HardwareAccelerations = "none",
+        channel_order: Literal["rgb", "bgr"] = "rgb",
+        reuse_buffer: bool = False,
     ):
-        self._cap = cv2.VideoCapture(path, CAPTURE_BACKEND_DICT[backend])
+        if channel_order not in ("rgb", "bgr"):
+            raise ValueError(f"channel_order must be 'rgb' or 'bgr', not {channel_order}")
+        if backend not in CAPTURE_BACKENDS_SET:
+            raise ValueError(f"Invalid backend: {backend}")
+        if hardware_acceleration == "none":
+            self._cap = cv2.VideoCapture(path, CAPTURE_BACKEND_DICT[backend])
+        else:
+            # Asking for hardware acceleration routes decode through NVDEC/VAAPI/...
+            # when the backend supports it; otherwise OpenCV silently falls back
+            # to software decode, so this is safe to request speculatively.
+            self._cap = cv2.VideoCapture(
+                path,
+                CAPTURE_BACKEND_DICT[backend],
+                [cv2.CAP_PROP_HW_ACCELERATION, HARDWARE_ACCELERATION_DICT[hardware_acceleration]],
+            )
         self.path = path
+        self.stride = stride
+        self._channel_order = channel_order
+        self._reuse_buffer = reuse_buffer
+        self._frame_buf: Optional[np.ndarray] = None
 
         self._info = _generate_capture_info_wrapper(self._cap)
 
     @property
     def fps(self) -> float:
-        return self._cap.get(cv2.CAP_PROP_FPS)
+        return self._cap.get(_CAP_PROP_FPS)
 
     @fps.setter
     def fps(self, value: float):
-        if self._cap.set(cv2.CAP_PROP_FPS, value):
+        if self._cap.set(_CAP_PROP_FPS, value):
             self._wait_time = 1 / value if value > 0 else 0
         else:
             raise RuntimeError(f'Failed to set fps to {value}')
@@ -116,15 +237,258 @@ class VideoReader(CVVideo):
     def info(self) -> VideoCaptureProperties:
         return self._info
 
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @stride.setter
+    def stride(self, value: int):
+        if not isinstance(value, int):
+            raise TypeError(f"stride must be an int, not {type(value)}")
+        if value < 1:
+            raise ValueError(f"stride must be a positive integer, not {value}")
+        self._stride = value
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Decode the next frame into a caller-provided buffer.
+
+        The companion to ``reuse_buffer``: instead of the reader retaining its
+        own decode buffer, the caller supplies one -- e.g. a slice of a larger
+        batch array or memory shared with another library -- and no frame-sized
+        allocation happens at all. The stride setting applies as in iteration.
+
+        Args:
+            out:
+                Destination with the frame's (H, W, 3) shape and uint8 dtype.
+                Filled in the reader's channel order.
+
+        Returns:
+            True if a frame was decoded into ``out``, False at end of stream.
+
+        Examples:
+            >>> video = read_video_from_file("video.mp4")
+            >>> buf = np.empty((video.info.frame_height, video.info.frame_width, 3), np.uint8)
+            >>> while video.read_into(buf):
+            >>>     process(buf)
+        """
+        if not self._cap.grab():
+            return False
+        ret, frame = self._cap.retrieve()
+        if not ret:
+            return False
+        for _ in range(self._stride - 1):
+            if not self._cap.grab():
+                break
+        if self._channel_order == "bgr":
+            np.copyto(out, frame)
+        else:
+            # cvtColor with dst= swaps the channels straight into the caller's
+            # memory in one SIMD pass; no intermediate RGB array exists.
+            _cvt_color(frame, _COLOR_BGR2RGB, dst=out)
+        return True
+
+    def read_batch(self, indices) -> np.ndarray:
+        """Decode an arbitrary set of frames into one preallocated batch.
+
+        Fetching scattered frames through plain iteration decodes everything in
+        between. Here the indices are visited in ascending order and each one is
+        reached either by grabbing through small forward gaps (container
+        advance, no decode) or by a positional seek, which the backend resolves
+        as nearest-prior-keyframe plus forward decode -- so per-GOP setup work
+        is paid once per jump instead of once per frame. Frames land directly
+        in one (N, H, W, 3) buffer allocated up front.
+
+        Requires a seekable source (file or URL); live device captures cannot
+        seek backwards.
+
+        Args:
+            indices: Frame indices to decode, in any order.
+
+        Returns:
+            A uint8 ndarray of shape (N, H, W, 3) with rows matching the order
+            of ``indices``, in the reader's channel order.
+
+        Raises:
+            IndexError: If an index is past the end of the stream.
+            ValueError: If an index is negative.
+        """
+        indices = [int(i) for i in indices]
+        height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        batch = np.empty((len(indices), height, width, 3), dtype=np.uint8)
+        if not indices:
+            return batch
+        if min(indices) < 0:
+            raise ValueError(f"frame indices must be non-negative, got {min(indices)}")
+
+        pos = int(self._cap.get(_CAP_PROP_POS_FRAMES))
+        for row in sorted(range(len(indices)), key=indices.__getitem__):
+            target = indices[row]
+            if target < pos or target - pos > _SEEK_THRESHOLD:
+                self._cap.set(_CAP_PROP_POS_FRAMES, target)
+                pos = target
+            while pos < target:
+                if not self._cap.grab():
+                    raise IndexError(f"frame index {target} is out of range")
+                pos += 1
+            ret, frame = self._cap.read()
+            if not ret:
+                raise IndexError(f"frame index {target} is out of range")
+            pos += 1
+            if self._channel_order == "bgr":
+                batch[row] = frame
+            else:
+                batch[row] = frame[:, :, ::-1]
+        return batch
+
+    def grab(self) -> bool:
+        """Advance the stream by one frame without decoding it.
+
+        Grabbing only runs the demuxer; the YUV->BGR decode is deferred until
+        :meth:`retrieve`. Sampling loops that keep 1 frame in N can therefore
+        grab through the other N-1 and pay decode cost only for the frames
+        they actually use (the ``stride`` attribute does exactly this during
+        iteration).
+
+        Returns:
+            True if a frame was grabbed, False at end of stream.
+
+        See Also:
+            https://docs.opencv.org/4.x/d8/dfe/classcv_1_1VideoCapture.html
+        """
+        return self._cap.grab()
+
+    def retrieve(self) -> Optional[CVImage]:
+        """Decode the frame most recently advanced to by :meth:`grab`.
+
+        Returns:
+            The decoded frame in the reader's channel order, or None if no
+            grabbed frame is available.
+        """
+        ret, frame = self._cap.retrieve()
+        if not ret:
+            return None
+        if self._channel_order == "bgr":
+            return frame.view(CVImage)
+        return frame[:, :, ::-1].view(CVImage)
+
+    def skip(self, n: int) -> int:
+        """Advance ``n`` source frames without decoding them.
+
+        cap.grab() only moves the demuxer forward, so skipping costs container
+        parsing instead of a full decode per frame -- the same trick the
+        ``stride`` attribute uses between yielded frames, exposed here for
+        one-off jumps (e.g. skipping an intro before iterating).
+
+        Args:
+            n: Number of frames to skip.
+
+        Returns:
+            The number of frames actually skipped; less than ``n`` only when
+            the stream ends first.
+        """
+        if not isinstance(n, int):
+            raise TypeError(f"n must be an int, not {type(n)}")
+        if n < 0:
+            raise ValueError(f"n must be a non-negative integer, not {n}")
+        for skipped in range(n):
+            if not self._cap.grab():
+                return skipped
+        return n
+
     def __next__(self) -> CVImage:
-        ret, frame = self._cap.read()
-        if ret:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).view(CVImage)
+        # cap.grab() only advances the demuxer; the decoder runs in cap.retrieve().
+        # Skipped frames are therefore never decoded, which makes subsampled
+        # iteration roughly stride times cheaper than calling cap.read() per frame.
+        if not self._cap.grab():
+            raise StopIteration
+        if self._frame_buf is not None:
+            # Decoding into the retained buffer avoids a fresh H*W*3 allocation
+            # per frame; cap.retrieve hands the same array back when it fits.
+            ret, frame = self._cap.retrieve(self._frame_buf)
         else:
+            ret, frame = self._cap.retrieve()
+        if not ret:
             raise StopIteration
+        if self._reuse_buffer:
+            self._frame_buf = frame
+        for _ in range(self._stride - 1):
+            if not self._cap.grab():
+                break
+        if self._channel_order == "bgr":
+            # Frames are decoded BGR; handing the buffer out untouched keeps it
+            # contiguous for consumers that feed cv2 routines directly.
+            return frame.view(CVImage)
+        # Reversing the channel axis is a stride trick on the decoded BGR buffer,
+        # so no extra frame-sized copy is made per frame (unlike cv2.cvtColor).
+        return frame[:, :, ::-1].view(CVImage)
+
+    def iter_prefetched(self, prefetch: int = 4) -> Iterator[CVImage]:
+        """Iterate over frames with a background decode thread.
+
+        Plain iteration is serial: Python waits for the decoder, then the decoder
+        idles while Python processes the frame. Here a producer thread keeps a
+        bounded queue of decoded frames topped up (cv2 releases the GIL while
+        decoding), so decode overlaps with the consumer's compute. The bounded
+        queue gives back-pressure: the producer stalls instead of running ahead
+        of a slow consumer.
+
+        Args:
+            prefetch: maximum number of decoded frames buffered ahead.
+
+        Yields:
+            Frames in order, exactly as plain iteration would produce them.
+        """
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be a positive integer, not {prefetch}")
+
+        frames: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def producer():
+            try:
+                while not stop.is_set():
+                    try:
+                        frame = next(self)
+                    except StopIteration:
+                        break
+                    # With a shared decode buffer each queued frame would be
+                    # overwritten by the next; queue private copies instead.
+                    if self._reuse_buffer:
+                        frame = frame.copy()
+                    while not stop.is_set():
+                        try:
+                            frames.put(frame, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+            finally:
+                # An abandoned generator sets stop with the queue still full; an
+                # unconditional blocking put would then wedge this thread (and
+                # its capture) forever. A consumer that still wants the sentinel
+                # is draining the queue, so the stop-aware timed put delivers it
+                # as soon as a slot frees, and gives up once stop is set.
+                while True:
+                    try:
+                        frames.put(None, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if stop.is_set():
+                            break
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        try:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            stop.set()
 
     def __len__(self) -> Optional[int]:
-        length = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        length = int(self._cap.get(_CAP_PROP_FRAME_COUNT))
         if length > 0:
             return length
         else:
@@ -137,12 +501,18 @@ class VideoReader(CVVideo):
 def read_video_from_device(
     device: int,
     backend: CaptureBackends = "auto",
+    buffer_size: int = 1,
 ) -> VideoReader:
     """Read video from a device.
 
     Args:
         device: Device number. Most times, your camera is 0.
         backend: Backend to use for capturing video.
+        buffer_size:
+            Driver-side frame queue depth. The default of 1 yields the newest
+            frame: V4L2 otherwise buffers ~4 frames, which at 60 fps is ~66 ms
+            of queueing latency before a frame ever reaches Python. Backends
+            that do not support the property ignore it.
 
     Notes:
         Some parameters of info(e.g. width, height) can not be set when the video is read by some backends.
@@ -173,18 +543,51 @@ def read_video_from_device(
     if device < 0:
         raise ValueError(f"device must be a positive integer, not {device}")
 
-    return VideoReader(device, backend=backend)
+    video = VideoReader(device, backend=backend)
+    if not video._cap.set(_CAP_PROP_BUFFERSIZE, buffer_size):
+        # Without the cap the driver queues ~4 frames, so reads lag the sensor
+        # by that many frame intervals; worth telling the caller about.
+        warnings.warn(f"backend ignored CAP_PROP_BUFFERSIZE={buffer_size}; "
+                      f"frames may lag the device by a few intervals")
+    return video
 
 
 def read_video_from_file(
     path: Union[str, os.PathLike],
     backend: CaptureBackends = "auto",
+    stride: int = 1,
+    hardware_acceleration: HardwareAccelerations = "none",
+    frame_size: Optional[Tuple[int, int]] = None,
+    fourcc: Optional[FourCC] = None,
+    channel_order: Literal["rgb", "bgr"] = "rgb",
+    reuse_buffer: bool = False,
 ) -> VideoReader:
     """Read video from a file.
 
     Args:
         path: Path to the video file.
         backend: Backend to use for capturing video.
+        hardware_acceleration:
+            Hardware decoder to request (e.g. "any" picks NVDEC/VAAPI/D3D11 when available).
+            Falls back to software decode when the backend cannot provide it.
+        frame_size:
+            Decode-size hint as (height, width). Backends that can scale inside the
+            decoder (e.g. GStreamer, MJPEG sources) emit frames at this size directly,
+            which is much cheaper than decoding at full resolution and resizing in
+            Python. Backends that cannot honor the hint ignore it.
+        fourcc:
+            Codec hint for the capture. Useful for devices/streams that offer several
+            pixel formats; ignored by backends that do not support codec selection.
+        stride:
+            Number of source frames advanced per iteration. Frames skipped by the stride are
+            only grabbed, never decoded, so ``stride=15`` on a 30 FPS video samples 2 FPS
+            while doing roughly 1/15 of the decode work.
+        channel_order:
+            Channel order of the yielded frames ("rgb" by default; "bgr" skips even the
+            view swap and hands out the native decoded buffer).
+        reuse_buffer:
+            Decode every frame into one retained buffer instead of allocating per
+            frame. Frames kept across iterations must be copied by the caller.
 
     Returns:
         A Video object.
@@ -210,7 +613,110 @@ def read_video_from_file(
     if not os.path.isfile(path):
         raise FileNotFoundError(f"file not found: {os.path.abspath(path)}")
 
-    return VideoReader(path, backend=backend)
+    if hasattr(os, 'posix_fadvise'):
+        # Start an asynchronous read of the head of the container into the page
+        # cache before the capture opens it, so header parsing and the first
+        # decodes hit warm pages. WILLNEED acts on the page cache and therefore
+        # outlives this throwaway descriptor (SEQUENTIAL would not: it only
+        # tunes the readahead window of the fd it is issued on). The hint is
+        # bounded so a multi-gigabyte file is not pulled in wholesale; steady-
+        # state readahead is the kernel's job on the capture's own descriptor.
+        # Best effort: special files may refuse the hint.
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 32 * 1024 * 1024, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    video = VideoReader(path,
+                        backend=backend,
+                        stride=stride,
+                        hardware_acceleration=hardware_acceleration,
+                        channel_order=channel_order,
+                        reuse_buffer=reuse_buffer)
+    # OpenCV buffers up to 4 decoded frames ahead by default, which only costs
+    # memory for sequential file reads. Not every backend supports the property,
+    # so a failed set is ignored — the same applies to the hints below.
+    video._cap.set(_CAP_PROP_BUFFERSIZE, 1)
+    if frame_size is not None:
+        video._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, frame_size[0])
+        video._cap.set(cv2.CAP_PROP_FRAME_WIDTH, frame_size[1])
+    if fourcc is not None:
+        video._cap.set(cv2.CAP_PROP_FOURCC, fourcc_code(fourcc))
+    return video
+
+
+def read_video_to_ndarray(
+    path: Union[str, os.PathLike],
+    backend: CaptureBackends = "auto",
+    stride: int = 1,
+    max_frames: Optional[int] = None,
+    layout: Literal["interleaved", "planar"] = "interleaved",
+) -> np.ndarray:
+    """Read a whole video file into a single ndarray.
+
+    The destination buffer is allocated once up front (sized from the container's
+    frame count), so decoding runs as a tight fill loop without per-frame Python
+    allocations or a final np.stack copy.
+
+    Args:
+        path: Path to the video file.
+        backend: Backend to use for capturing video.
+        stride: Number of source frames advanced per stored frame (see ``read_video_from_file``).
+        max_frames: Upper bound on the number of frames to read. None reads to the end.
+        layout:
+            Memory layout of the returned buffer. "interleaved" stores pixels as
+            (frames, height, width, 3); "planar" stores channel planes as
+            (frames, 3, height, width), which keeps each channel contiguous so
+            batched per-channel operations run as unit-stride passes.
+
+    Returns:
+        A numpy.ndarray with dtype uint8 and RGB channel order. The shape is
+        (frames, height, width, 3) for "interleaved" layout and (frames, 3, height, width)
+        for "planar" layout.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the video reports no frames.
+
+    Examples:
+        >>> frames = read_video_to_ndarray("video.mp4")
+        >>> frames.shape
+        (300, 1080, 1920, 3)
+    """
+    video = read_video_from_file(path, backend=backend, stride=stride)
+
+    frame_count = int(video._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    height = int(video._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    width = int(video._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    if frame_count <= 0 or height <= 0 or width <= 0:
+        raise ValueError(f"cannot preallocate buffer for video with unknown size: {os.path.abspath(path)}")
+
+    length = -(-frame_count // stride)
+    if max_frames is not None:
+        length = min(length, max_frames)
+
+    if layout == "planar":
+        buffer = np.empty((length, 3, height, width), dtype=np.uint8)
+    elif layout == "interleaved":
+        buffer = np.empty((length, height, width, 3), dtype=np.uint8)
+    else:
+        raise ValueError(f"layout must be 'interleaved' or 'planar', not {layout}")
+
+    idx = 0
+    for frame in video:
+        if idx >= length:
+            break
+        if layout == "planar":
+            buffer[idx] = np.moveaxis(frame, -1, 0)
+        else:
+            buffer[idx] = frame
+        idx += 1
+
+    return buffer[:idx]
 
 
 def read_video_from_url(
@@ -244,36 +750,7 @@ def read_video_from_url(
 
 
 def _generate_writer_info_wrapper(writer: cv2.VideoWriter) -> VideoWriterProperties:  # type: ignore
-    properties = VideoWriterProperties()  # type: ignore
-
-    def __getattribute__(self, item):
-        if item in properties.__fields__.keys():
-            setattr(properties, item, writer.get(getattr(cv2, properties.__fields__[item].alias)))
-            return getattr(properties, item)
-        else:
-            raise AttributeError(f'{properties.__class__.__name__} has no attribute {item}')
-
-    def __setattr__(self, key, value):
-        if key in properties.__fields__.keys():
-            setattr(properties, key, value)
-            if writer.set(getattr(cv2, properties.__fields__[key].alias), getattr(properties, key)):
-                return
-            else:
-                raise RuntimeError(f'Failed to set {key} to {value}')
-        else:
-            raise AttributeError(f'{properties.__class__.__name__} has no attribute {key}')
-
-    def __repr__(self: VideoWriterProperties):
-        return str(f"VideoWriterProperties("
-                   f"quality={self.quality}, n_frames={self.n_frames}, frame_bytes={self.frame_bytes})")
-
-    return type(
-        'VideoWriterProperties', (object,), {
-            '__doc__': VideoWriterProperties.__doc__,
-            '__getattribute__': __getattribute__,
-            '__setattr__': __setattr__,
-            '__repr__': __repr__,
-        })()
+    return _WriterInfoProxy(writer)
 
 
 class BaseVideoWriter(metaclass=ABCMeta):
@@ -294,6 +771,10 @@ class BaseVideoWriter(metaclass=ABCMeta):
         write: Write a frame to the video.
     """
 
+    # Empty on purpose: without it every slotted subclass would still grow a
+    # per-instance __dict__ inherited from here.
+    __slots__ = ()
+
     @abstractmethod
     def write(self, frame: np.ndarray):
         """Write a frame to the video.
@@ -320,6 +801,11 @@ class VideoWriter(BaseVideoWriter):
         fps: Frames per second.
         frame_size: Size of the video frame. The shape of the frame should be (height, width).
         is_color: Whether the video is color or not.
+        input_format:
+            Channel order of the frames handed to ``write``. "rgb" (default)
+            converts to the encoder's BGR order; "bgr" writes frames untouched,
+            which pairs with a ``channel_order="bgr"`` reader for a fully
+            copy-free read-write loop.
 
     Methods:
         write: Write a frame to the video.
@@ -333,6 +819,9 @@ class VideoWriter(BaseVideoWriter):
         https://docs.opencv.org/3.4/dd/d9e/classcv_1_1VideoWriter.html
     """
 
+    __slots__ = ('_writer', '_path', '_fps', '_frame_size', '_fourcc', '_is_color', '_input_format', '_bgr_buf',
+                 '_info', '_write_queue', '_write_thread', '_write_exc')
+
     def __init__(
         self,
         path: Union[str, os.PathLike],
@@ -340,10 +829,18 @@ class VideoWriter(BaseVideoWriter):
         frame_size: Tuple[int, int],
         fourcc: FourCC = "mp4v",
         is_color: bool = True,
+        input_format: Literal["rgb", "bgr"] = "rgb",
     ):
+        # assigned before any validation can raise, so __del__ on a
+        # half-constructed instance finds them
+        self._write_queue: Optional[queue.Queue] = None
+        self._write_thread: Optional[threading.Thread] = None
+        self._write_exc: Optional[BaseException] = None
+        if input_format not in ("rgb", "bgr"):
+            raise ValueError(f"input_format must be 'rgb' or 'bgr', not {input_format}")
         self._writer = cv2.VideoWriter(
             path,
-            cv2.VideoWriter_fourcc(*fourcc),
+            fourcc_code(fourcc),
             fps,
             frame_size[::-1],
             is_color,
@@ -355,6 +852,8 @@ class VideoWriter(BaseVideoWriter):
         self._frame_size = frame_size
         self._fourcc = fourcc
         self._is_color = is_color
+        self._input_format = input_format
+        self._bgr_buf: Optional[np.ndarray] = None
 
         self._info = _generate_writer_info_wrapper(self._writer)
 
@@ -381,13 +880,94 @@ class VideoWriter(BaseVideoWriter):
     def write(self, frame: np.ndarray):
         assert frame.shape[:2] == self.frame_size, ValueError(
             f"frame size must be {self.frame_size}, not {frame.shape[:2]}")
-        self._writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        if self._input_format == "bgr":
+            # Caller already has the encoder's native order (e.g. frames from a
+            # channel_order="bgr" reader); hand it over untouched.
+            self._writer.write(frame)
+            return
+        # Frames from VideoReader are reversed views over a contiguous BGR
+        # buffer, so reversing again recovers that buffer for free. Anything
+        # else gets one cvtColor pass into a retained destination buffer, which
+        # beats handing the encoder a negative-stride view it would copy
+        # internally anyway and skips the per-frame allocation.
+        bgr = frame[:, :, ::-1]
+        if not bgr.flags['C_CONTIGUOUS']:
+            if self._bgr_buf is None or self._bgr_buf.shape != frame.shape:
+                self._bgr_buf = np.empty_like(frame)
+            bgr = _cvt_color(frame, _COLOR_RGB2BGR, dst=self._bgr_buf)
+        self._writer.write(bgr)
+
+    def write_async(self, frame: np.ndarray, maxsize: int = 8):
+        """Queue a frame for encoding on a background thread.
+
+        ``cv2.VideoWriter.write`` releases the GIL around the encoder, so a
+        dedicated writer thread genuinely overlaps encoding with whatever the
+        caller does next (typically decoding the following frame) -- the write
+        analogue of :meth:`VideoReader.iter_prefetched`. The thread and its
+        bounded queue start lazily on the first call; ``flush`` (or closing
+        the writer) drains the queue and joins the thread.
+
+        Frames are queued by reference, not copied: a caller that reuses its
+        frame buffer (``reuse_buffer=True`` readers) must pass ``frame.copy()``.
+
+        Args:
+            frame: Frame to encode, same contract as :meth:`write`.
+            maxsize: Queue depth used when the background thread starts.
+
+        Raises:
+            RuntimeError: Re-raised from the background thread if a queued
+                write failed; subsequent frames after the failure are dropped.
+        """
+        if self._write_exc is not None:
+            self._raise_write_exc()
+        if self._write_thread is None:
+            self._write_queue = queue.Queue(maxsize=maxsize)
+            self._write_thread = threading.Thread(target=self._drain_writes, daemon=True)
+            self._write_thread.start()
+        self._write_queue.put(frame)
+
+    def _drain_writes(self):
+        while True:
+            frame = self._write_queue.get()
+            if frame is None:
+                return
+            if self._write_exc is None:
+                try:
+                    self.write(frame)
+                except BaseException as e:  # keep draining so put() never deadlocks
+                    self._write_exc = e
+
+    def _raise_write_exc(self):
+        exc = self._write_exc
+        self._write_exc = None
+        raise RuntimeError("background write failed") from exc
+
+    def flush(self):
+        """Block until every frame queued via ``write_async`` is encoded."""
+        if self._write_thread is not None:
+            self._write_queue.put(None)
+            self._write_thread.join()
+            self._write_thread = None
+            self._write_queue = None
+        if self._write_exc is not None:
+            self._raise_write_exc()
+
+    def _close(self):
+        try:
+            self.flush()
+        except RuntimeError:
+            # a failed background write already dropped the remaining frames;
+            # nothing useful can be raised from teardown
+            pass
+        writer = getattr(self, '_writer', None)
+        if writer is not None:
+            writer.release()
 
     def __del__(self):
-        self._writer.release()
+        self._close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._writer.release()
+        self._close()
@@ -1,8 +1,8 @@
-from typing import Tuple, Union
+from typing import Literal, Tuple, Union
 
 import pythoncv.functions as f
 from pythoncv.core.transformer import Filter
-from pythoncv.core.types.filter import BORDER_TYPES_DICT, BorderTypes
+from pythoncv.core.types.filter import BORDER_TYPES_DICT, BORDER_TYPES_SET, BorderTypes
 from pythoncv.utils import type_assert
 
 
@@ -10,22 +10,33 @@ from pythoncv.utils import type_assert
     ksize=(tuple, list, int),
     anchor=tuple,
     border_type=str,
+    device=str,
 )
 def box_blur(
         ksize: Union[Tuple[int, int], int] = (3, 3),
         anchor: Tuple[int, int] = (-1, -1),
         normalize: bool = True,
         border_type: BorderTypes = "reflect101",
+        device: Literal["cpu", "opencl"] = "cpu",
 ) -> Filter:
     if isinstance(ksize, int):
         ksize = (ksize, ksize)
     if len(ksize) != 2:
         raise ValueError(f"Invalid ksize: {ksize}")
 
-    if border_type not in BORDER_TYPES_DICT:
+    if border_type not in BORDER_TYPES_SET:
         raise ValueError(f"Invalid border type: {border_type}")
+    if device not in ("cpu", "opencl"):
+        raise ValueError(f"Invalid device: {device}")
 
-    return Filter.make(f.box_blur, ksize, anchor, normalize, border_type)
+    # device="opencl" dispatches through the T-API (cv2.UMat); on builds
+    # without OpenCL it silently runs the CPU path, like device="cuda" below.
+    return Filter.make(f.box_blur,
+                       ksize,
+                       anchor,
+                       normalize,
+                       BORDER_TYPES_DICT[border_type],
+                       use_opencl=(device == "opencl"))
 
 
 @type_assert(
@@ -35,10 +46,10 @@ def box_blur(
 )
 def blur(ksize: Tuple[int, int] = (3, 3),
          anchor: Tuple[int, int] = (-1, -1), border_type: BorderTypes = "reflect101") -> Filter:
-    if border_type not in BORDER_TYPES_DICT:
+    if border_type not in BORDER_TYPES_SET:
         raise ValueError(f"Invalid border type: {border_type}")
 
-    return Filter.make(f.blur, ksize, anchor, border_type)
+    return Filter.make(f.blur, ksize, anchor, BORDER_TYPES_DICT[border_type])
 
 
 @type_assert(
@@ -46,15 +57,29 @@ def blur(ksize: Tuple[int, int] = (3, 3),
     sigma_x=(int, float),
     sigma_y=(int, float),
     border_type=str,
+    device=str,
 )
 def gaussian_blur(ksize: Tuple[int, int] = (3, 3),
                   sigma_x: float = 0,
                   sigma_y: float = 0,
-                  border_type: BorderTypes = "reflect101") -> Filter:
-    if border_type not in BORDER_TYPES_DICT:
+                  border_type: BorderTypes = "reflect101",
+                  device: Literal["cpu", "cuda", "opencl"] = "cpu") -> Filter:
+    if border_type not in BORDER_TYPES_SET:
         raise ValueError(f"Invalid border type: {border_type}")
-
-    return Filter.make(f.gaussian_blur, ksize, sigma_x, sigma_y, border_type)
+    if device not in ("cpu", "cuda", "opencl"):
+        raise ValueError(f"Invalid device: {device}")
+
+    # device="cuda" routes through the cached cv2.cuda filter objects in
+    # pythoncv.functions, device="opencl" through the T-API; on builds
+    # without the matching device either silently runs the CPU path, so
+    # the flag is safe to set speculatively.
+    return Filter.make(f.gaussian_blur,
+                       ksize,
+                       sigma_x,
+                       sigma_y,
+                       BORDER_TYPES_DICT[border_type],
+                       use_cuda=(device == "cuda"),
+                       use_opencl=(device == "opencl"))
 
 
 @type_assert()
@@ -74,9 +99,13 @@ def bilateral_filter(
     return Filter.make(f.bilateral_filter, d, sigma_color, sigma_space)
 
 
-@type_assert(radius=(tuple, list))
-def stack_blur(radius: Tuple[int, int] = (3, 3),) -> Filter:
-    return Filter.make(f.stack_blur, radius)
+@type_assert(radius=(tuple, list, int), device=str)
+def stack_blur(radius: Union[Tuple[int, int], int] = (3, 3), device: Literal["cpu", "opencl"] = "cpu") -> Filter:
+    if isinstance(radius, int):
+        radius = (radius, radius)
+    if device not in ("cpu", "opencl"):
+        raise ValueError(f"Invalid device: {device}")
+    return Filter.make(f.stack_blur, tuple(radius), use_opencl=(device == "opencl"))
 
 
 @type_assert(
@@ -89,7 +118,9 @@ def square_blur(
         normalize: bool = True,
         border_type: BorderTypes = "reflect101",
 ) -> Filter:
-    if border_type not in BORDER_TYPES_DICT:
+    if border_type not in BORDER_TYPES_SET:
         raise ValueError(f"Invalid border type: {border_type}")
 
-    return Filter.make(f.square_blur, ksize, anchor, normalize, border_type)
+    if isinstance(ksize, int):
+        ksize = (ksize, ksize)
+    return Filter.make(f.square_blur, tuple(ksize), anchor, normalize, BORDER_TYPES_DICT[border_type])
@@ -7,8 +7,7 @@ Most time, you will not need to use these functions directly.
 import functools as ft
 import inspect
 import warnings
-from typing import _Final  # type: ignore
-from typing import Union
+from typing import Any, Union, get_origin
 
 
 # TODO: Add support for type hints, and type checking fro typing.
@@ -79,14 +78,23 @@ def type_assert(**type_assertions):
     """
 
     def decorator(func):
+        # Bail before any introspection: under -O, or when there is nothing to
+        # check at all, decoration costs a couple of attribute loads and the
+        # function ships unwrapped.
         if not __debug__:
             return func
+        if not type_assertions and not func.__annotations__:
+            return func
 
         # map function argument names to supplied type assertions
         annotations = func.__annotations__
         annotations.update(type_assertions)
 
-        block_list = [key for (key, value) in annotations.items() if isinstance(value, _Final)]
+        # Typing forms (Union, Optional, Literal, ...) cannot go through
+        # isinstance; detect them with the public get_origin instead of the
+        # private typing._Final, which this used to rely on. Bare Any has no
+        # origin and needs its own check.
+        block_list = [key for (key, value) in annotations.items() if value is Any or get_origin(value) is not None]
         for key in block_list:
             if key not in type_assertions:
                 warnings.warn(
@@ -100,19 +108,57 @@ def type_assert(**type_assertions):
 
         # get the signature of the function
         sig = inspect.signature(func)
+        params = list(sig.parameters.values())
+        checked = [param for param in params if param.name in annotations]
+        if not checked:
+            return func
 
-        @ft.wraps(func)
-        def wrapper(*args, **kwargs):
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            for name, value in bound_args.arguments.items():
-                if name in annotations:
-                    if not isinstance(value, annotations[name]):
-                        raise TypeError(f"Argument '{name}' must be of type '{annotations[name]}'")
-
-            return func(*args, **kwargs)
-
-        return wrapper
+        # Generate a wrapper specialized to this signature instead of going
+        # through sig.bind()/apply_defaults() on every call: the wrapper
+        # mirrors the function's own parameter list (so defaults are applied
+        # by the interpreter) and runs a direct isinstance check per annotated
+        # argument. All signature introspection happens once, here.
+        namespace = {'_func': func}
+        pieces = []
+        forward = []
+        saw_star = False
+        for param in params:
+            if param.kind is param.VAR_POSITIONAL:
+                pieces.append('*' + param.name)
+                forward.append('*' + param.name)
+                saw_star = True
+            elif param.kind is param.VAR_KEYWORD:
+                pieces.append('**' + param.name)
+                forward.append('**' + param.name)
+            else:
+                if param.kind is param.KEYWORD_ONLY and not saw_star:
+                    pieces.append('*')
+                    saw_star = True
+                if param.default is param.empty:
+                    pieces.append(param.name)
+                else:
+                    namespace[f'_d_{param.name}'] = param.default
+                    pieces.append(f'{param.name}=_d_{param.name}')
+                if param.kind is param.KEYWORD_ONLY:
+                    forward.append(f'{param.name}={param.name}')
+                else:
+                    forward.append(param.name)
+                if param.kind is param.POSITIONAL_ONLY:
+                    position = params.index(param)
+                    if position + 1 == len(params) or params[position + 1].kind is not param.POSITIONAL_ONLY:
+                        pieces.append('/')
+
+        checks = []
+        for param in checked:
+            namespace[f'_t_{param.name}'] = annotations[param.name]
+            namespace[f'_e_{param.name}'] = f"Argument '{param.name}' must be of type '{annotations[param.name]}'"
+            checks.append(f'    if not isinstance({param.name}, _t_{param.name}):\n'
+                          f'        raise TypeError(_e_{param.name})')
+
+        name = func.__name__ if func.__name__.isidentifier() else 'wrapper'
+        source = 'def {}({}):\n{}\n    return _func({})\n'.format(name, ', '.join(pieces), '\n'.join(checks),
+                                                                  ', '.join(forward))
+        exec(compile(source, f'<pythoncv.type_assert:{func.__qualname__}>', 'exec'), namespace)
+        return ft.wraps(func)(namespace[name])
 
     return decorator
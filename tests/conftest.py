@@ -0,0 +1,53 @@
+import mmap
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+
+@pytest.fixture(scope='module')
+def _random_image_stock():
+    # Filled once per module: the PCG fill is the expensive part, the per-test
+    # copy below is a plain memcpy.
+    return np.random.default_rng(0).integers(0, 255, (100, 100, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def random_image(_random_image_stock):
+    """A (100, 100, 3) uint8 test image; a fresh copy per test, so inplace
+    blurs cannot leak into the next test."""
+    return _random_image_stock.copy()
+
+
+@pytest.fixture(scope='session')
+def sample_jpg_bytes():
+    """The encoded demos/sample.jpg, read from disk once per session."""
+    with open('demos/sample.jpg', 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='session')
+def sample_jpg_mmap():
+    """demos/sample.jpg as a read-only mmap: a zero-copy view of the page
+    cache, shared by every test that decodes from a buffer."""
+    with open('demos/sample.jpg', 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
+
+
+@pytest.fixture(scope='session')
+def sample_jpg_array(request):
+    """demos/sample.jpg decoded (RGB), as a read-only reference array.
+
+    The decode (~270 ms with PIL) runs once per machine, not once per session:
+    the result is cached as an .npy under the gitignored pytest cache dir and
+    mmap-loaded on later runs, so pages come straight from the page cache as
+    the comparisons read them. The cache is keyed on the source file's mtime
+    and size, so swapping sample.jpg regenerates it.
+    """
+    src = os.stat('demos/sample.jpg')
+    cached = request.config.cache.mkdir('pythoncv') / f'sample.{int(src.st_mtime)}.{src.st_size}.ref.npy'
+    if not cached.is_file():
+        np.save(cached, np.asarray(Image.open('demos/sample.jpg')))
+    return np.load(cached, mmap_mode='r')
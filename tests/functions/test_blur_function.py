@@ -1,94 +1,118 @@
 import pytest
 
+from tests.utils import bytes_equal
+
 from pythoncv.functions.blur import *
 
 
-def test_box_blur(mocker):
+def test_box_blur(mocker, random_image):
     mocker.spy(cv2, 'boxFilter')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = box_blur(arr)
 
     cv2.boxFilter.assert_called_once()
-    assert not np.allclose(arr, result)
+    assert not bytes_equal(arr, result)
 
     result = box_blur(arr, ksize=(3, 3), inplace=True)
-    assert np.allclose(arr, result)
+    assert bytes_equal(arr, result)
     cv2.boxFilter.assert_called_with(arr, -1, (3, 3), arr, (-1, -1), True, cv2.BORDER_REFLECT_101)
 
 
-def test_blur(mocker):
+def test_blur(mocker, random_image):
     mocker.spy(cv2, 'blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = blur(arr)
 
     cv2.blur.assert_called_once()
-    assert not np.allclose(arr, result)
+    assert not bytes_equal(arr, result)
 
     result = blur(arr, ksize=(3, 3), inplace=True)
-    assert np.allclose(arr, result)
+    assert bytes_equal(arr, result)
     cv2.blur.assert_called_with(arr, (3, 3), arr, (-1, -1), cv2.BORDER_REFLECT_101)
 
 
-def test_gaussian_blur(mocker):
+def test_gaussian_blur(mocker, random_image):
     mocker.spy(cv2, 'GaussianBlur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = gaussian_blur(arr)
 
     cv2.GaussianBlur.assert_called_once()
-    assert not np.allclose(arr, result)
+    assert not bytes_equal(arr, result)
 
     result = gaussian_blur(arr, ksize=(3, 3), inplace=True)
-    assert np.allclose(arr, result)
+    assert bytes_equal(arr, result)
     cv2.GaussianBlur.assert_called_with(arr, (3, 3), 0, arr, 0, cv2.BORDER_REFLECT_101)
 
 
-def test_median_blur(mocker):
+def test_median_blur(mocker, random_image):
     mocker.spy(cv2, 'medianBlur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = median_blur(arr)
 
     cv2.medianBlur.assert_called_once()
+    assert not bytes_equal(arr, result)
+
+    result = median_blur(arr, ksize=3, inplace=True)
+    assert bytes_equal(arr, result)
+    cv2.medianBlur.assert_called_with(arr, 3, arr)
+
+
+def test_median_blur_numba_fallback():
+    # float64 input is rejected by cv2.medianBlur and goes through the numba kernel.
+    arr = np.random.rand(16, 16, 3)
+    result = median_blur(arr, ksize=3)
+    ref = cv2.medianBlur(arr.astype(np.float32), 3)
     assert not np.allclose(arr, result)
+    assert np.allclose(result, ref, atol=1e-6)
 
     result = median_blur(arr, ksize=3, inplace=True)
     assert np.allclose(arr, result)
-    cv2.medianBlur.assert_called_with(arr, 3, arr)
 
 
-def test_bilateral_filter(mocker):
+def test_bilateral_filter(mocker, random_image):
     mocker.spy(cv2, 'bilateralFilter')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = bilateral_filter(arr)
 
     cv2.bilateralFilter.assert_called_once()
-    assert not np.allclose(arr, result)
+    assert not bytes_equal(arr, result)
 
     with pytest.raises(NotImplementedError):
         result = bilateral_filter(arr, d=5, inplace=True)
 
 
-def test_stack_blur(mocker):
+def test_bilateral_filter_per_channel(random_image):
+    arr = random_image
+    result = bilateral_filter(arr, per_channel=True)
+
+    assert result.shape == arr.shape
+    for c in range(3):
+        ref = cv2.bilateralFilter(np.ascontiguousarray(arr[..., c]), 5, 75, 75)
+        assert np.array_equal(result[..., c], ref)
+
+
+def test_stack_blur(mocker, random_image):
     mocker.spy(cv2, 'stackBlur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = stack_blur(arr)
 
     cv2.stackBlur.assert_called_once()
     ori = cv2.stackBlur.call_args[0][0]
     dst = cv2.stackBlur.call_args[0][2]
     assert ori is not dst
-    assert not np.allclose(arr, result)
+    assert not bytes_equal(arr, result)
 
     result = stack_blur(arr, ksize=3, inplace=True)
-    assert np.allclose(arr, result)
+    assert bytes_equal(arr, result)
     cv2.stackBlur.assert_called_with(arr, (3, 3), arr)
     ori = cv2.stackBlur.call_args[0][0]
     dst = cv2.stackBlur.call_args[0][2]
     assert ori is dst
 
 
-def test_square_blur(mocker):
+def test_square_blur(mocker, random_image):
     mocker.spy(cv2, 'sqrBoxFilter')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     result = square_blur(arr)
 
     cv2.sqrBoxFilter.assert_called_once()
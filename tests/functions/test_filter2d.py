@@ -0,0 +1,46 @@
+import cv2
+import numpy as np
+
+from tests.utils import RNG
+from pythoncv.functions import filter2d, get_gaussian_kernel
+from pythoncv.functions.filter2d import _maybe_separable
+
+
+def test_maybe_separable():
+    kernel = get_gaussian_kernel(5) @ get_gaussian_kernel(5).T
+    factors = _maybe_separable(kernel)
+
+    assert factors is not None
+    kx, ky = factors
+    assert np.allclose(np.outer(ky, kx), kernel)
+
+    assert _maybe_separable(np.random.rand(5, 5)) is None
+
+
+def test_filter2d():
+    x = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    kernel = np.random.rand(5, 5).astype(np.float32)
+    kernel /= kernel.sum()
+
+    result = filter2d(x, kernel)
+
+    assert result.shape == x.shape
+    assert np.array_equal(result, cv2.filter2D(x, -1, kernel))
+
+
+def test_filter2d_separable():
+    x = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    kernel = get_gaussian_kernel(5) @ get_gaussian_kernel(5).T
+
+    result = filter2d(x, kernel)
+    reference = cv2.filter2D(x, -1, kernel)
+
+    assert result.shape == x.shape
+    assert np.abs(result.astype(np.int16) - reference.astype(np.int16)).max() <= 1
+
+
+def test_filter2d_inplace():
+    x = RNG.integers(0, 255, size=(32, 32, 3), dtype=np.uint8)
+    result = filter2d(x, np.full((3, 3), 1 / 9, dtype=np.float32), inplace=True)
+
+    assert result is x
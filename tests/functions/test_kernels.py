@@ -0,0 +1,51 @@
+import cv2
+import numpy as np
+import pytest
+
+from pythoncv.functions import (get_deriv_kernels, get_gabor_kernel, get_gaussian_kernel, get_structuring_element)
+
+
+def test_get_deriv_kernels():
+    kx, ky = get_deriv_kernels(1, 0, ksize=3)
+    ref_kx, ref_ky = cv2.getDerivKernels(1, 0, 3)
+
+    assert np.array_equal(kx, ref_kx)
+    assert np.array_equal(ky, ref_ky)
+
+
+def test_get_gaussian_kernel():
+    kernel = get_gaussian_kernel(5)
+
+    assert kernel.shape == (5, 1)
+    assert np.isclose(kernel.sum(), 1.0)
+    assert np.array_equal(kernel, cv2.getGaussianKernel(5, -1))
+
+    for ksize, sigma in [(9, -1), (15, -1), (11, 2.0)]:
+        assert np.allclose(get_gaussian_kernel(ksize, sigma), cv2.getGaussianKernel(ksize, sigma), atol=1e-12)
+
+
+def test_get_gabor_kernel():
+    kernel = get_gabor_kernel((9, 7), sigma=2, theta=0, lambd=4, gamma=0.5)
+
+    assert kernel.shape == (9, 7)
+
+
+def test_get_structuring_element():
+    element = get_structuring_element('rect', (3, 5))
+
+    assert element.shape == (3, 5)
+    assert np.all(element == 1)
+
+    with pytest.raises(ValueError):
+        get_structuring_element('circle', (3, 3))
+
+
+def test_kernels_are_cached_and_read_only():
+    kernel = get_gaussian_kernel(7)
+
+    assert get_gaussian_kernel(7) is kernel
+    assert not kernel.flags.writeable
+    with pytest.raises(ValueError):
+        kernel[0] = 0
+
+    assert get_structuring_element('ellipse', (5, 5)) is get_structuring_element('ellipse', (5, 5))
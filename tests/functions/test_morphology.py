@@ -0,0 +1,39 @@
+import cv2
+import numpy as np
+
+from tests.utils import RNG
+from pythoncv.functions import dilation, erosion, get_structuring_element
+
+
+def test_dilation():
+    x = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    kernel = np.asarray(get_structuring_element('rect', (3, 3)))
+
+    result = dilation(x)
+
+    assert result.shape == x.shape
+    assert np.array_equal(result, cv2.dilate(x, kernel))
+
+
+def test_erosion():
+    x = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    kernel = np.asarray(get_structuring_element('ellipse', (5, 5)))
+
+    result = erosion(x, kernel)
+
+    assert result.shape == x.shape
+    assert np.array_equal(result, cv2.erode(x, kernel))
+
+
+def test_iterations_are_composed():
+    x = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    kernel = np.asarray(get_structuring_element('rect', (3, 3)))
+
+    assert np.array_equal(dilation(x, kernel, iterations=3), cv2.dilate(x, kernel, iterations=3))
+    assert np.array_equal(erosion(x, kernel, iterations=3), cv2.erode(x, kernel, iterations=3))
+
+
+def test_morphology_inplace():
+    x = RNG.integers(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    assert dilation(x, inplace=True) is x
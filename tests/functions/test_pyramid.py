@@ -0,0 +1,38 @@
+import cv2
+import numpy as np
+import pytest
+
+from tests.utils import RNG
+from pythoncv.functions import build_pyramid, pyr_down, pyr_up
+
+
+def test_pyr_down():
+    arr = RNG.integers(0, 255, size=(100, 120, 3), dtype=np.uint8)
+    result = pyr_down(arr)
+
+    assert result.shape == (50, 60, 3)
+    assert np.array_equal(result, cv2.pyrDown(arr))
+
+    result = pyr_down(arr, dst_size=(50, 60))
+    assert result.shape == (50, 60, 3)
+
+
+def test_pyr_up():
+    arr = RNG.integers(0, 255, size=(50, 60, 3), dtype=np.uint8)
+    result = pyr_up(arr)
+
+    assert result.shape == (100, 120, 3)
+    assert np.array_equal(result, cv2.pyrUp(arr))
+
+
+def test_build_pyramid():
+    arr = RNG.integers(0, 255, size=(96, 96, 3), dtype=np.uint8)
+    pyramid = build_pyramid(arr, max_level=3)
+
+    assert len(pyramid) == 4
+    assert pyramid[0] is arr
+    assert [level.shape[0] for level in pyramid] == [96, 48, 24, 12]
+    assert np.array_equal(pyramid[1], pyr_down(arr))
+
+    with pytest.raises(ValueError):
+        build_pyramid(arr, max_level=-1)
@@ -0,0 +1,28 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from tests.utils import RNG
+from pythoncv.functions import gaussian_blur, tile_apply
+
+
+def test_tile_apply_matches_whole_image():
+    arr = RNG.integers(0, 255, size=(100, 130, 3), dtype=np.uint8)
+    fn = partial(gaussian_blur, ksize=(3, 3))
+
+    ref = fn(arr)
+    result = tile_apply(arr, fn, tile_size=(32, 48), halo=1)
+
+    assert result.shape == arr.shape
+    assert np.array_equal(ref, result)
+
+
+def test_tile_apply_illegal_parameters():
+    arr = RNG.integers(0, 255, size=(16, 16, 3), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        tile_apply(arr, lambda t: t, tile_size=(0, 8))
+
+    with pytest.raises(ValueError):
+        tile_apply(arr, lambda t: t, halo=-1)
@@ -29,8 +29,10 @@ def test_display_video(mocker):
 
     _ = window.aspect_ratio
     cv2.getWindowProperty.assert_called_once_with('test', cv2.WND_PROP_ASPECT_RATIO)
+    # The content is never asserted, so one frame shown ten times is enough.
+    frame = RNG.integers(0, 255, size=(480, 640, 3), dtype=np.uint8)
     for _ in range(10):
-        window.write(np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8))
+        window.write(frame)
 
     window.close()
     cv2.destroyWindow.assert_called_once_with('test')
@@ -44,8 +46,9 @@ def test_display_video_with_context_manager(mocker):
         cv2.getWindowImageRect.assert_called_once_with('test')
         _ = window.aspect_ratio
         cv2.getWindowProperty.assert_called_once_with('test', cv2.WND_PROP_ASPECT_RATIO)
+        frame = RNG.integers(0, 255, size=(480, 640, 3), dtype=np.uint8)
         for _ in range(10):
-            window.write(np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8))
+            window.write(frame)
         cv2.destroyWindow.assert_not_called()
 
     cv2.destroyWindow.assert_called_once_with('test')
@@ -53,7 +56,7 @@ def test_display_video_with_context_manager(mocker):
     with pytest.raises(RuntimeError):
         del window
         window = VideoWindow(name='test', size=(640, 480), type='normal')
-        window.write(np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8))
+        window.write(RNG.integers(0, 255, size=(480, 640, 3), dtype=np.uint8))
 
 
 @pytest.mark.skipif(check_in_ci(), reason="Skip in CI. Can not open window with certainty monitor size.")
@@ -1,20 +1,22 @@
+import cv2
 import pytest
-from PIL import Image
+
+from tests.utils import bytes_equal
 from pythoncv.io.image import *
 
 
-def test_read_image_from_file():
+def test_read_image_from_file(sample_jpg_array):
     image = read_image_from_file('demos/sample.jpg')
     assert image.shape[2] == 3
     assert isinstance(image, np.ndarray)
     assert type(image) == CVImage
 
     image = read_image_from_file('demos/sample.jpg')
-    ref_image = np.array(Image.open('demos/sample.jpg'))
+    ref_image = sample_jpg_array
     assert isinstance(image, np.ndarray)
     assert type(image) == CVImage
 
-    assert np.all(image == ref_image)
+    assert bytes_equal(np.ascontiguousarray(image), ref_image)
 
     image = read_image_from_file('demos/sample.jpg', color_mode='grayscale')
     assert len(image.shape) == 2
@@ -30,44 +32,39 @@ def test_read_image_from_file():
         image = read_image_from_file('demos/sample.jpg', color_mode='unchanged', reduce_ratio=8)
 
 
-def test_read_image_from_bytes():
-    with open('demos/sample.jpg', 'rb') as f:
-        image = read_image_from_bytes(f.read())
-        assert image.shape[2] == 3
-        assert isinstance(image, np.ndarray)
-        assert type(image) == CVImage
+def test_read_image_from_bytes(sample_jpg_mmap, sample_jpg_array):
+    image = read_image_from_bytes(sample_jpg_mmap)
+    assert image.shape[2] == 3
+    assert isinstance(image, np.ndarray)
+    assert type(image) == CVImage
 
-    with open('demos/sample.jpg', 'rb') as f:
-        ref_image = np.array(Image.open('demos/sample.jpg'))
+    ref_image = sample_jpg_array
 
-    assert np.all(image == ref_image)
+    assert bytes_equal(np.ascontiguousarray(image), ref_image)
 
-    with open('demos/sample.jpg', 'rb') as f:
-        image = read_image_from_bytes(f.read(), color_mode='grayscale')
-        assert len(image.shape) == 2
-        assert isinstance(image, np.ndarray)
-        assert type(image) == CVImage
+    image = read_image_from_bytes(sample_jpg_mmap, color_mode='grayscale')
+    assert len(image.shape) == 2
+    assert isinstance(image, np.ndarray)
+    assert type(image) == CVImage
 
-    with open('demos/sample.jpg', 'rb') as f:
-        image = read_image_from_bytes(f.read(), color_mode='color', reduce_ratio=4)
+    image = read_image_from_bytes(sample_jpg_mmap, color_mode='color', reduce_ratio=4)
 
     assert image.shape[0] == ref_image.shape[0] // 4
     assert image.shape[1] == ref_image.shape[1] // 4
 
     with pytest.raises(AttributeError):
-        with open('demos/sample.jpg', 'rb') as f:
-            image = read_image_from_bytes(f.read(), color_mode='unchanged', reduce_ratio=8)
+        image = read_image_from_bytes(sample_jpg_mmap, color_mode='unchanged', reduce_ratio=8)
 
 
-def test_read_image():
+def test_read_image(sample_jpg_bytes, sample_jpg_array):
     image = read_image('demos/sample.jpg')
     assert image.shape[2] == 3
     assert isinstance(image, np.ndarray)
     assert type(image) == CVImage
 
-    ref_image = np.array(Image.open('demos/sample.jpg'))
+    ref_image = sample_jpg_array
 
-    assert np.all(image == ref_image)
+    assert bytes_equal(np.ascontiguousarray(image), ref_image)
 
     image = read_image('demos/sample.jpg', color_mode='grayscale')
     assert len(image.shape) == 2
@@ -80,18 +77,16 @@ def test_read_image():
     with pytest.raises(AttributeError):
         image = read_image('demos/sample.jpg', color_mode='unchanged', reduce_ratio=8)
 
-    with open('demos/sample.jpg', 'rb') as f:
-        image = read_image(f.read(), color_mode='color', reduce_ratio=4)
+    image = read_image(sample_jpg_bytes, color_mode='color', reduce_ratio=4)
 
     assert image.shape[0] == ref_image.shape[0] // 4
     assert image.shape[1] == ref_image.shape[1] // 4
 
     with pytest.raises(AttributeError):
-        with open('demos/sample.jpg', 'rb') as f:
-            image = read_image(f.read(), color_mode='unchanged', reduce_ratio=8)
+        image = read_image(sample_jpg_bytes, color_mode='unchanged', reduce_ratio=8)
 
 
-def test_write_image_to_file():
+def test_write_image_to_file(sample_jpg_array):
     import tempfile
 
     image = read_image('demos/sample.jpg')
@@ -101,7 +96,7 @@ def test_write_image_to_file():
         image = read_image(tmpdir + '/sample.jpg')
         assert image.shape[2] == 3
 
-        ref_image = np.array(Image.open('demos/sample.jpg'))
+        ref_image = sample_jpg_array
         assert np.allclose(image, ref_image, atol=10)
 
     image = read_image('demos/sample.jpg')
@@ -113,7 +108,7 @@ def test_write_image_to_file():
         image = read_image(tmpdir + '/sample.jpg')
         assert image.shape[2] == 3
 
-        ref_image = np.array(Image.open('demos/sample.jpg'))
+        ref_image = sample_jpg_array
         assert np.allclose(image, ref_image, atol=10)
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -130,13 +125,13 @@ def test_write_image_to_file():
         assert os.path.getsize(tmpdir + '/sample.jpg') < os.path.getsize('demos/sample.jpg')
 
 
-def test_write_image_to_bytes():
+def test_write_image_to_bytes(sample_jpg_array):
     image = read_image('demos/sample.jpg')
     image_bytes = write_image_to_bytes(image)
     image = read_image_from_bytes(image_bytes)
     assert image.shape[2] == 3
 
-    ref_image = np.array(Image.open('demos/sample.jpg'))
+    ref_image = sample_jpg_array
     assert np.allclose(image, ref_image, atol=10)
 
     image_bytes = write_image_to_bytes(image, type='png')
@@ -148,3 +143,51 @@ def test_write_image_to_bytes():
     image = read_image_from_bytes(image_bytes)
     assert image.shape[2] == 3
     assert len(image_bytes) < os.path.getsize('demos/sample.jpg')
+
+
+def test_read_image_contiguous_and_out():
+    image = read_image_from_file('demos/sample.jpg')
+    assert image.flags['C_CONTIGUOUS']
+
+    out = np.empty_like(image)
+    result = read_image_from_file('demos/sample.jpg', out=out)
+    assert np.shares_memory(result, out)
+    assert np.array_equal(result, image)
+
+
+def test_read_images():
+    images = read_images(['demos/sample.jpg'] * 3)
+    reference = read_image_from_file('demos/sample.jpg')
+
+    assert len(images) == 3
+    for image in images:
+        assert np.array_equal(image, reference)
+
+    assert read_images([]) == []
+
+
+def test_write_images(sample_jpg_array):
+    import tempfile
+
+    image = read_image('demos/sample.jpg')
+    ref_image = sample_jpg_array
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [tmpdir + f'/sample_{i}.jpg' for i in range(3)]
+        write_images([image] * 3, paths, type='jpeg')
+
+        for path in paths:
+            assert np.allclose(read_image(path), ref_image, atol=10)
+
+    with pytest.raises(ValueError):
+        write_images([image], ['a.jpg', 'b.jpg'])
+
+    write_images([], [])
+
+
+def test_read_image_umat():
+    image = read_image_from_file('demos/sample.jpg')
+    umat = read_image_from_file('demos/sample.jpg', use_umat=True)
+
+    assert isinstance(umat, cv2.UMat)
+    assert np.array_equal(umat.get(), image)
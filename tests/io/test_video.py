@@ -160,13 +160,206 @@ def test_write_video_to_file():
     del writer
 
     tmp_video = read_video_from_file(tmp_path)
-    ori_video = read_video_from_file('demos/sample.mp4')
-    assert len(tmp_video) == len(ori_video)
+    assert len(tmp_video) == len(video)
     assert tmp_video.info.fps == video.info.fps
     assert tmp_video.info.frame_height == video.info.frame_height
     assert tmp_video.info.frame_width == video.info.frame_width
 
 
+def test_write_video_pipelined():
+    """Test the background-decode to background-encode pipeline."""
+    import tempfile
+
+    video = read_video_from_file('demos/sample.mp4')
+    tmp_path = tempfile.mktemp(suffix='.mp4')
+
+    with VideoWriter(tmp_path, video.fps, (video.info.frame_height, video.info.frame_width), "mp4v") as writer:
+        for frame in video.iter_prefetched():
+            writer.write_async(frame)
+        writer.flush()
+
+    tmp_video = read_video_from_file(tmp_path)
+    assert len(tmp_video) == len(video)
+    assert tmp_video.info.frame_height == video.info.frame_height
+    assert tmp_video.info.frame_width == video.info.frame_width
+
+
+def test_write_video_bgr_input():
+    """Test the copy-free bgr reader to bgr writer loop."""
+    import tempfile
+
+    video = read_video_from_file('demos/sample.mp4', channel_order='bgr')
+    tmp_path = tempfile.mktemp(suffix='.mp4')
+
+    writer = VideoWriter(tmp_path,
+                         video.fps, (video.info.frame_height, video.info.frame_width),
+                         "mp4v",
+                         input_format='bgr')
+    for idx, frame in enumerate(video):
+        writer.write(frame)
+        if idx == 10:
+            break
+    del writer
+
+    assert len(read_video_from_file(tmp_path)) == 11
+
+    with pytest.raises(ValueError):
+        VideoWriter(tmp_path, 30, (10, 10), "mp4v", input_format='hsv')
+
+
+def test_read_video_reuse_buffer():
+    """Test that reuse_buffer decodes successive frames into one buffer."""
+    video = read_video_from_file('demos/sample.mp4', reuse_buffer=True)
+    first = next(video)
+    second = next(video)
+
+    assert np.shares_memory(first, second)
+
+    reference = read_video_from_file('demos/sample.mp4')
+    next(reference)
+    assert np.array_equal(second, next(reference))
+
+    default = read_video_from_file('demos/sample.mp4')
+    assert not np.shares_memory(next(default), next(default))
+
+
+def test_iter_prefetched():
+    """Test that prefetched iteration yields the same frames as plain iteration."""
+    video = read_video_from_file('demos/sample.mp4', stride=30)
+    reference = read_video_from_file('demos/sample.mp4', stride=30)
+
+    prefetched = list(video.iter_prefetched(prefetch=2))
+
+    assert len(prefetched) > 0
+    for frame, ref in zip(prefetched, reference):
+        assert np.array_equal(frame, ref)
+
+    with pytest.raises(ValueError):
+        next(read_video_from_file('demos/sample.mp4').iter_prefetched(prefetch=0))
+
+
+def test_read_into():
+    """Test decoding into a caller-provided buffer."""
+    video = read_video_from_file('demos/sample.mp4')
+    reference = read_video_from_file('demos/sample.mp4')
+
+    buf = np.empty((video.info.frame_height, video.info.frame_width, 3), np.uint8)
+    assert video.read_into(buf)
+    assert np.array_equal(buf, next(reference))
+    assert video.read_into(buf)
+    assert np.array_equal(buf, next(reference))
+
+    tail = read_video_from_file('demos/sample.mp4')
+    tail.skip(10**6)
+    assert not tail.read_into(buf)
+
+
+def test_read_batch():
+    """Test batched random-access decode against sequential iteration."""
+    video = read_video_from_file('demos/sample.mp4')
+    reference = list(read_video_from_file('demos/sample.mp4', stride=10).iter_prefetched())
+
+    batch = video.read_batch([20, 0, 10])
+    assert batch.shape == (3, video.info.frame_height, video.info.frame_width, 3)
+    assert np.array_equal(batch[0], reference[2])
+    assert np.array_equal(batch[1], reference[0])
+    assert np.array_equal(batch[2], reference[1])
+
+    assert video.read_batch([]).shape[0] == 0
+
+    with pytest.raises(ValueError):
+        video.read_batch([-1])
+    with pytest.raises(IndexError):
+        video.read_batch([10**9])
+
+
+def test_video_skip():
+    """Test that skip advances frames without decoding them."""
+    video = read_video_from_file('demos/sample.mp4')
+    reference = read_video_from_file('demos/sample.mp4')
+
+    assert video.skip(5) == 5
+    for _ in range(5):
+        next(reference)
+    assert np.array_equal(next(video), next(reference))
+
+    assert video.skip(10**6) < 10**6
+
+    with pytest.raises(ValueError):
+        video.skip(-1)
+    with pytest.raises(TypeError):
+        video.skip(1.5)
+
+
+def test_video_info_update():
+    """Test bulk property update on the info proxy."""
+    video = read_video_from_file('demos/sample.mp4')
+    video.info.update(pos_frames=10)
+    assert video.info.pos_frames == 10
+
+    with pytest.raises(KeyError):
+        video.info.update(not_a_property=1)
+
+    # frame size is only settable on device captures, not files
+    with pytest.raises(RuntimeError):
+        video.info.update(frame_width=1280)
+
+
+def test_video_grab_retrieve():
+    """Test that grab/retrieve sample frames equivalently to iteration."""
+    video = read_video_from_file('demos/sample.mp4')
+    reference = read_video_from_file('demos/sample.mp4')
+
+    for _ in range(3):
+        assert video.grab()
+    frame = video.retrieve()
+    for _ in range(3):
+        expected = next(reference)
+    assert np.array_equal(frame, expected)
+
+    while video.grab():
+        pass
+    assert not video.grab()
+
+
+def test_frame_array_interface():
+    """Test that frames hand their buffer to interop consumers without a copy."""
+    video = read_video_from_file('demos/sample.mp4')
+    frame = next(video)
+
+    interface = frame.__array_interface__
+    assert interface['shape'] == frame.shape
+    assert interface['typestr'] == '|u1'
+
+    assert np.shares_memory(np.asarray(frame), frame)
+
+
+def test_read_video_to_ndarray():
+    """Test batch read of a video file into one ndarray."""
+    frames = read_video_to_ndarray('demos/sample.mp4', stride=30, max_frames=5)
+    video = read_video_from_file('demos/sample.mp4')
+
+    assert isinstance(frames, np.ndarray)
+    assert frames.dtype == np.uint8
+    assert frames.shape == (5, video.info.frame_height, video.info.frame_width, 3)
+    assert np.array_equal(frames[0], next(video))
+
+    with pytest.raises(FileNotFoundError):
+        read_video_to_ndarray('demos/sample.mp5')
+
+
+def test_read_video_to_ndarray_planar():
+    """Test planar (channel-first) batch read layout."""
+    planar = read_video_to_ndarray('demos/sample.mp4', stride=30, max_frames=2, layout='planar')
+    interleaved = read_video_to_ndarray('demos/sample.mp4', stride=30, max_frames=2)
+
+    assert planar.shape == (2, 3, interleaved.shape[1], interleaved.shape[2])
+    assert np.array_equal(planar, np.moveaxis(interleaved, -1, 1))
+
+    with pytest.raises(ValueError):
+        read_video_to_ndarray('demos/sample.mp4', layout='nchw')
+
+
 def test_video_properties():
     video = read_video_from_file('demos/sample.mp4')
     cap = cv2.VideoCapture('demos/sample.mp4')
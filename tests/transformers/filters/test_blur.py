@@ -2,12 +2,14 @@ import cv2  # type: ignore
 import numpy as np
 import pytest
 
+from tests.utils import bytes_equal
+
 from pythoncv.transformers.filters.blur import *
 
 
-def test_box_blur_filter(mocker):
+def test_box_blur_filter(mocker, random_image):
     mocker.spy(f, 'box_blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = box_blur()
     assert f.box_blur.call_count == 0
     result = fn(arr)
@@ -15,12 +17,12 @@ def test_box_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.boxFilter(arr, -1, (3, 3), arr, (-1, -1), True, cv2.BORDER_REFLECT_101)
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_blur_filter(mocker):
+def test_blur_filter(mocker, random_image):
     mocker.spy(f, 'blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = blur()
     assert f.blur.call_count == 0
     result = fn(arr)
@@ -28,12 +30,12 @@ def test_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.blur(arr, (3, 3), arr, (-1, -1), cv2.BORDER_REFLECT_101)
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_gaussian_blur_filter(mocker):
+def test_gaussian_blur_filter(mocker, random_image):
     mocker.spy(f, 'gaussian_blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = gaussian_blur()
     assert f.gaussian_blur.call_count == 0
     result = fn(arr)
@@ -41,12 +43,12 @@ def test_gaussian_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.GaussianBlur(arr, (3, 3), 0, arr, 0, cv2.BORDER_REFLECT_101)
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_median_blur_filter(mocker):
+def test_median_blur_filter(mocker, random_image):
     mocker.spy(f, 'median_blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = median_blur()
     assert f.median_blur.call_count == 0
     result = fn(arr)
@@ -54,21 +56,21 @@ def test_median_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.medianBlur(arr, 3, arr)
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_bilateral_filter_filter(mocker):
+def test_bilateral_filter_filter(mocker, random_image):
     mocker.spy(f, 'bilateral_filter')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = bilateral_filter()
     assert f.bilateral_filter.call_count == 0
     result = fn(arr)
     f.bilateral_filter.assert_called_once()
 
 
-def test_stack_blur_filter(mocker):
+def test_stack_blur_filter(mocker, random_image):
     mocker.spy(f, 'stack_blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = stack_blur()
     assert f.stack_blur.call_count == 0
     result = fn(arr)
@@ -76,12 +78,12 @@ def test_stack_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.stackBlur(arr, (3, 3))
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_square_blur_filter(mocker):
+def test_square_blur_filter(mocker, random_image):
     mocker.spy(f, 'square_blur')
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+    arr = random_image
     fn = square_blur()
     assert f.square_blur.call_count == 0
     result = fn(arr)
@@ -89,10 +91,10 @@ def test_square_blur_filter(mocker):
 
     # Default parameters
     ref = cv2.sqrBoxFilter(arr, -1, (3, 3))
-    assert np.allclose(ref, result)
+    assert bytes_equal(ref, result)
 
 
-def test_illegal_box_filter_parameters():
+def test_illegal_box_filter_parameters(random_image):
     with pytest.raises(TypeError):
         fn = box_blur(ksize='3')
 
@@ -108,5 +110,5 @@ def test_illegal_box_filter_parameters():
     fn = box_blur(ksize=[3, 3])
     ref_fn = box_blur(ksize=3)
 
-    arr = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
-    assert np.allclose(ref_fn(arr), fn(arr))
+    arr = random_image
+    assert bytes_equal(ref_fn(arr), fn(arr))
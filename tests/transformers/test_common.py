@@ -0,0 +1,47 @@
+import numpy as np
+
+from tests.utils import RNG
+from pythoncv.core.transformer import Filter, Transformer
+from pythoncv.transformers.common import Pipeline
+
+
+def test_pipeline_applies_stages_in_order():
+    add_one = Filter.make(lambda x, step: x + step, 1)
+    double = Filter.make(lambda x, factor: x * factor, 2)
+    pipeline = Pipeline(add_one, double)
+
+    arr = np.arange(6, dtype=np.int64).reshape(2, 3)
+    assert np.array_equal(pipeline(arr), (arr + 1) * 2)
+
+
+def test_empty_pipeline_is_identity():
+    arr = np.zeros((2, 2), dtype=np.uint8)
+    assert Pipeline()(arr) is arr
+
+
+def test_pipeline_fuses_adjacent_gaussians():
+    from pythoncv.transformers.filters.blur import gaussian_blur, median_blur
+
+    arr = RNG.integers(0, 255, size=(64, 64, 3), dtype=np.uint8)
+    stages = (gaussian_blur((9, 9), 1.0, 1.0), gaussian_blur((9, 9), 1.0, 1.0))
+
+    fused = Pipeline(*stages, fuse=True)
+    sequential = Pipeline(*stages)
+
+    assert len(fused._transformers) == 1
+    assert len(sequential._transformers) == 2
+    assert np.allclose(fused(arr).astype(int), sequential(arr).astype(int), atol=3)
+
+    mixed = Pipeline(gaussian_blur(), median_blur(), gaussian_blur(), fuse=True)
+    assert len(mixed._transformers) == 3
+
+
+def test_pipeline_keeps_overridden_call():
+
+    class Doubling(Transformer):
+
+        def __call__(self, x):
+            return super().__call__(x) * 2
+
+    pipeline = Pipeline(Doubling(lambda x: x + 1))
+    assert pipeline(np.int64(1)) == 4
@@ -1,13 +1,50 @@
+import ctypes
 import os
 
+import numpy as np
+
+try:
+    _memcmp = ctypes.CDLL(None).memcmp
+    _memcmp.restype = ctypes.c_int
+    _memcmp.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)
+except (OSError, AttributeError):  # no loadable libc (e.g. Windows)
+    _memcmp = None
+
+# Shared PCG64 generator for test data: Generator.integers fills uint8 in a C
+# loop, roughly twice as fast as the legacy MT19937-backed np.random.randint.
+RNG = np.random.default_rng(0)
+
+
+def bytes_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Exact array equality via one libc memcmp pass.
+
+    np.all(a == b) materializes a boolean array the size of the inputs before
+    reducing it; memcmp scans the raw bytes with SIMD and stops at the first
+    mismatch, so multi-megabyte image comparisons cost one read pass and no
+    allocation.
+    """
+    if a.shape != b.shape or a.dtype != b.dtype:
+        return False
+    assert a.flags['C_CONTIGUOUS'] and b.flags['C_CONTIGUOUS']
+    if _memcmp is None:
+        return a.tobytes() == b.tobytes()
+    return _memcmp(a.ctypes.data, b.ctypes.data, a.nbytes) == 0
+
+
+# The CI markers never change mid-run, so read them once at import; the
+# check_* functions below are evaluated per skipif decoration at collection.
+_IN_GITHUB_ACTIONS = os.getenv("GITHUB_ACTIONS") == "true"
+_IN_GITLAB_CI = os.getenv("GITLAB_CI") == "true"
+_IN_CI = os.getenv("CI") == "true"
+
 
 def check_in_github_actions():
-    return os.getenv("GITHUB_ACTIONS") == "true"
+    return _IN_GITHUB_ACTIONS
 
 
 def check_in_gitlab_ci():
-    return os.getenv("GITLAB_CI") == "true"
+    return _IN_GITLAB_CI
 
 
 def check_in_ci():
-    return os.getenv("CI") == "true"
+    return _IN_CI